@@ -1,13 +1,13 @@
 """Configuration loading and validation."""
 
-import json
+import functools
 import logging
 import os
 from pathlib import Path
 from typing import Any, Optional
 
 from dotenv import load_dotenv
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 
 logger = logging.getLogger(__name__)
 
@@ -37,51 +37,90 @@ class AppConfig(BaseModel):
     routing: dict[str, str] = {}
     sources: dict[str, Any] = {}
 
+    # source_group -> resolved webhook URL (None if unrouted or unset)
+    _webhook_cache: dict[str, Optional[str]] = PrivateAttr(default_factory=dict)
+
+
+# (config_path, env_path) -> (config mtime, .env mtime, loaded config)
+_config_cache: dict[tuple[str, Optional[str]], tuple[int, Optional[int], AppConfig]] = {}
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    """Return a file's mtime in nanoseconds, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
 
 def load_config(
     config_path: str = "config.json",
     env_path: Optional[str] = ".env",
 ) -> AppConfig:
-    """Load .env and config.json, return validated AppConfig."""
-    if env_path:
-        env_file = Path(env_path)
-        if env_file.exists():
-            load_dotenv(env_file)
+    """Load .env and config.json, return validated AppConfig.
 
+    The result is cached until either file's mtime changes, so repeat calls
+    cost a couple of stat() calls.
+    """
     config_file = Path(config_path)
-    if not config_file.exists():
+    config_mtime = _mtime_ns(config_file)
+    if config_mtime is None:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_file) as f:
-        raw = json.load(f)
+    env_file = Path(env_path) if env_path else None
+    env_mtime = _mtime_ns(env_file) if env_file else None
 
-    config = AppConfig(**raw)
+    cache_key = (config_path, env_path)
+    cached = _config_cache.get(cache_key)
+    if cached and cached[0] == config_mtime and cached[1] == env_mtime:
+        return cached[2]
 
-    # Warn about missing webhook URLs
+    if env_mtime is not None:
+        load_dotenv(env_file)
+
+    # Parse and validate in one pass inside pydantic-core
+    config = AppConfig.model_validate_json(config_file.read_bytes())
+
+    # Resolve webhook URLs once up front and warn about missing ones here,
+    # rather than on every notification
     for source_group, env_var in config.routing.items():
-        if not os.environ.get(env_var):
+        url = os.environ.get(env_var)
+        if not url:
             logger.warning(
                 "Webhook env var %s for source group '%s' is not set",
                 env_var,
                 source_group,
             )
+        config._webhook_cache[source_group] = url or None
 
+    _config_cache[cache_key] = (config_mtime, env_mtime, config)
     return config
 
 
 def get_webhook_url(config: AppConfig, source_group: str) -> Optional[str]:
-    """Resolve webhook URL for a source group via routing config."""
+    """Resolve webhook URL for a source group via routing config.
+
+    Results are cached on the config, so each group is resolved (and any
+    warning logged) at most once.
+    """
+    try:
+        return config._webhook_cache[source_group]
+    except KeyError:
+        pass
+
+    url = None
     env_var = config.routing.get(source_group)
     if not env_var:
         logger.warning("No routing entry for source group '%s'", source_group)
-        return None
-    url = os.environ.get(env_var)
-    if not url:
-        logger.warning("Webhook env var %s is not set", env_var)
-        return None
+    else:
+        url = os.environ.get(env_var) or None
+        if not url:
+            logger.warning("Webhook env var %s is not set", env_var)
+    config._webhook_cache[source_group] = url
     return url
 
 
+@functools.lru_cache(maxsize=1)
 def is_dry_run() -> bool:
-    """Check if DRY_RUN is enabled."""
+    """Check if DRY_RUN is enabled. Read once per process."""
     return os.environ.get("DRY_RUN", "false").lower() in ("true", "1", "yes")
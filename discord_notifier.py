@@ -1,11 +1,24 @@
 """Discord webhook notification with embeds and retry logic."""
 
+import hashlib
 import logging
+import os
 import re
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Dict
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from tenacity import (
     retry,
     retry_if_exception_type,
@@ -14,14 +27,103 @@ from tenacity import (
 )
 
 from config import AppConfig, get_webhook_url, is_dry_run
+from fetchers.base import TokenBucket
 from models import Job
 
 logger = logging.getLogger(__name__)
 
 DISCORD_BLURPLE = 0x5865F2
 
-# Global rate limit tracker: webhook_url -> timestamp when cooldown expires
+# Discord accepts at most 10 embeds per webhook message
+MAX_EMBEDS_PER_MESSAGE = 10
+# Upper bound on webhooks posted to in parallel by notify_batch()
+MAX_CONCURRENT_WEBHOOKS = 8
+
+# Pooled session so consecutive webhook POSTs reuse the TLS connection to Discord
+_DISCORD_SESSION = requests.Session()
+_DISCORD_SESSION.mount("https://", HTTPAdapter(max_retries=0, pool_connections=32, pool_maxsize=32))
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Proactive per-webhook limit: Discord allows ~30 requests/minute per webhook
+WEBHOOK_RATE_PER_SEC = 0.5
+WEBHOOK_BURST = 5
+
+# Global rate limit tracker: sha256(webhook_url) -> timestamp when cooldown expires.
+# Only set after a 429; the token buckets below should normally prevent that.
+# Persisted to COOLDOWNS_PATH so a restart doesn't immediately hit the same 429.
+# Keys are hashed so webhook secrets never touch disk.
+COOLDOWNS_PATH = os.environ.get("DISCORD_COOLDOWNS_PATH", "state/discord_cooldowns.json")
 _rate_limit_cooldowns: Dict[str, float] = {}
+_cooldowns_lock = threading.Lock()
+
+
+def _cooldown_key(webhook_url: str) -> str:
+    return hashlib.sha256(webhook_url.encode()).hexdigest()
+
+
+def _cooldown_until(webhook_url: str) -> float:
+    return _rate_limit_cooldowns.get(_cooldown_key(webhook_url), 0)
+
+
+def _load_cooldowns(path: str | None = None) -> Dict[str, float]:
+    """Read persisted cooldowns, dropping any that have already expired."""
+    try:
+        data = orjson.loads(Path(path or COOLDOWNS_PATH).read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, orjson.JSONDecodeError):
+        logger.warning("Ignoring unreadable Discord cooldown file %s", path or COOLDOWNS_PATH)
+        return {}
+    now = time.time()
+    return {
+        key: float(until)
+        for key, until in data.items()
+        if isinstance(until, (int, float)) and until > now
+    }
+
+
+def _set_cooldown(webhook_url: str, until: float) -> None:
+    """Record a cooldown in memory and persist the unexpired set to disk."""
+    with _cooldowns_lock:
+        _rate_limit_cooldowns[_cooldown_key(webhook_url)] = until
+        now = time.time()
+        active = {k: v for k, v in _rate_limit_cooldowns.items() if v > now}
+        path = Path(COOLDOWNS_PATH)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "ab+") as f:
+                # Exclusive lock in case several workers share the state dir
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                f.seek(0)
+                try:
+                    on_disk = orjson.loads(f.read() or b"{}")
+                except orjson.JSONDecodeError:
+                    on_disk = {}
+                for key, other in on_disk.items():
+                    if isinstance(other, (int, float)) and other > active.get(key, now):
+                        active[key] = float(other)
+                f.truncate(0)
+                f.write(orjson.dumps(active))
+        except OSError:
+            logger.warning("Could not persist Discord cooldowns to %s", path, exc_info=True)
+
+
+_rate_limit_cooldowns.update(_load_cooldowns())
+
+
+# webhook_url -> TokenBucket
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def _get_bucket(webhook_url: str) -> TokenBucket:
+    with _buckets_lock:
+        bucket = _buckets.get(webhook_url)
+        if bucket is None:
+            bucket = _buckets[webhook_url] = TokenBucket(WEBHOOK_RATE_PER_SEC, WEBHOOK_BURST)
+        return bucket
 
 
 def build_embed(job: Job, matched_keywords: list[str]) -> dict:
@@ -34,8 +136,16 @@ def build_embed(job: Job, matched_keywords: list[str]) -> dict:
     embed = {
         "title": title,
         "color": DISCORD_BLURPLE,
+        # Empty values are dropped (Discord rejects fields without a value)
         "fields": [
-            {"name": "Source", "value": job.source_name, "inline": True},
+            {"name": name, "value": value, "inline": inline}
+            for name, value, inline in (
+                ("Source", job.source_name, True),
+                ("Location", job.location, True),
+                ("Remote", "Yes" if job.remote else "", True),
+                ("Matched Keywords", ", ".join(matched_keywords), False),
+            )
+            if value
         ],
     }
 
@@ -51,21 +161,6 @@ def build_embed(job: Job, matched_keywords: list[str]) -> dict:
             snippet = snippet[:2045] + "..."
         embed["description"] = snippet
 
-    if job.location:
-        embed["fields"].append(
-            {"name": "Location", "value": job.location, "inline": True}
-        )
-
-    if job.remote:
-        embed["fields"].append(
-            {"name": "Remote", "value": "Yes", "inline": True}
-        )
-
-    if matched_keywords:
-        embed["fields"].append(
-            {"name": "Matched Keywords", "value": ", ".join(matched_keywords), "inline": False}
-        )
-
     if job.posted_at:
         embed["timestamp"] = job.posted_at.isoformat()
 
@@ -124,8 +219,7 @@ def notify(job: Job, matched_keywords: list[str], config: AppConfig) -> bool:
 
     # Check if this webhook is currently rate-limited
     now = time.time()
-    cooldown_until = _rate_limit_cooldowns.get(webhook_url, 0)
-    if now < cooldown_until:
+    if now < _cooldown_until(webhook_url):
         # Still in cooldown, skip without blocking
         return False
 
@@ -137,7 +231,7 @@ def notify(job: Job, matched_keywords: list[str], config: AppConfig) -> bool:
         return True
     except DiscordRateLimitError as e:
         # Record the cooldown and return False to retry later
-        _rate_limit_cooldowns[webhook_url] = now + e.retry_after
+        _set_cooldown(webhook_url, now + e.retry_after)
         logger.warning("Discord rate limited for %s, cooldown until %s", job.source_group, time.ctime(now + e.retry_after))
         return False
     except DiscordWebhookNotFoundError:
@@ -157,6 +251,94 @@ def notify(job: Job, matched_keywords: list[str], config: AppConfig) -> bool:
         return False
 
 
+def notify_batch(
+    jobs_with_matches: list[tuple[Job, list[str]]], config: AppConfig
+) -> list[bool]:
+    """Post many job embeds, packing up to 10 per webhook message.
+
+    Jobs are grouped by webhook URL so each Discord channel receives as few
+    POSTs as possible. Webhooks have independent rate limits, so groups are
+    delivered concurrently. Returns one success flag per input job, in input
+    order, with the same semantics as notify().
+    """
+    results = [False] * len(jobs_with_matches)
+    if not jobs_with_matches:
+        return results
+
+    if is_dry_run():
+        for job, _ in jobs_with_matches:
+            logger.info("[DRY RUN] Would notify: %s — %s (%s)", job.company, job.title, job.url)
+        return [True] * len(jobs_with_matches)
+
+    # webhook_url -> indexes into jobs_with_matches
+    groups: dict[str, list[int]] = defaultdict(list)
+    for i, (job, _) in enumerate(jobs_with_matches):
+        webhook_url = get_webhook_url(config, job.source_group)
+        if not webhook_url:
+            logger.warning("No webhook URL for source group '%s', skipping", job.source_group)
+            continue
+        groups[webhook_url].append(i)
+
+    if not groups:
+        return results
+
+    def send_group(webhook_url: str, indexes: list[int]) -> None:
+        for start in range(0, len(indexes), MAX_EMBEDS_PER_MESSAGE):
+            batch = indexes[start:start + MAX_EMBEDS_PER_MESSAGE]
+            sent = _send_batch(webhook_url, [jobs_with_matches[i] for i in batch], config)
+            if sent is None:
+                # Rate limited — leave the rest of this webhook's jobs for next cycle
+                return
+            for i, ok in zip(batch, sent):
+                results[i] = ok
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_WEBHOOKS, len(groups))) as executor:
+        # list() propagates any unexpected exception from a worker
+        list(executor.map(send_group, groups.keys(), groups.values()))
+
+    return results
+
+
+def _send_batch(
+    webhook_url: str, items: list[tuple[Job, list[str]]], config: AppConfig
+) -> list[bool] | None:
+    """Send one multi-embed message. Returns per-job results, or None if rate-limited."""
+    now = time.time()
+    if now < _cooldown_until(webhook_url):
+        return None
+
+    source_group = items[0][0].source_group
+    payload = {"embeds": [build_embed(job, matched) for job, matched in items]}
+
+    try:
+        _send_with_retry(webhook_url, payload)
+        return [True] * len(items)
+    except DiscordRateLimitError as e:
+        _set_cooldown(webhook_url, now + e.retry_after)
+        logger.warning("Discord rate limited for %s, cooldown until %s", source_group, time.ctime(now + e.retry_after))
+        return None
+    except DiscordWebhookNotFoundError:
+        logger.error(
+            "Webhook for '%s' returned 404 (deleted?). Skipping %d job(s) to avoid infinite retries.",
+            source_group, len(items),
+        )
+        return [True] * len(items)  # Mark as seen so we don't retry forever
+    except DiscordBadRequestError:
+        if len(items) == 1:
+            job = items[0][0]
+            logger.error(
+                "Discord rejected payload for %s (400 Bad Request). URL=%s. Marking as seen.",
+                job.uid, job.url,
+            )
+            return [True]  # Mark as seen — payload is permanently invalid
+        # One bad embed rejects the whole message; resend individually to isolate it
+        logger.warning("Discord rejected batch of %d embeds for %s, retrying one by one", len(items), source_group)
+        return [notify(job, matched, config) for job, matched in items]
+    except Exception:
+        logger.exception("Failed to send Discord batch of %d job(s) for %s", len(items), source_group)
+        return [False] * len(items)
+
+
 @retry(
     retry=retry_if_exception_type(DiscordServerError),
     stop=stop_after_attempt(3),
@@ -165,7 +347,13 @@ def notify(job: Job, matched_keywords: list[str], config: AppConfig) -> bool:
 )
 def _send_with_retry(webhook_url: str, payload: dict) -> None:
     """POST to Discord webhook with retry only on 5xx. Raises DiscordRateLimitError on 429."""
-    resp = requests.post(webhook_url, json=payload, timeout=15)
+    wait = _get_bucket(webhook_url).acquire()
+    if wait:
+        time.sleep(wait)
+
+    resp = _DISCORD_SESSION.post(
+        webhook_url, data=orjson.dumps(payload), headers=_JSON_HEADERS, timeout=15
+    )
 
     if resp.status_code == 429:
         # Prefer Retry-After header, fallback to JSON body or default
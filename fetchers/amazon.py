@@ -1,15 +1,18 @@
 """Fetcher for Amazon Jobs search API."""
 
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, parse_json, resilient_get, strip_html, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://www.amazon.jobs/en/search.json"
 
+# Concurrent page requests after the first page
+MAX_WORKERS = 8
+
 
 class AmazonFetcher(BaseFetcher):
     source_group = "maang"
@@ -20,55 +23,65 @@ class AmazonFetcher(BaseFetcher):
         self._result_limit = source_config.get("result_limit", 100)
 
     def fetch(self) -> list[Job]:
-        jobs = []
-        offset = 0
-
-        while True:
-            resp = resilient_get(
-                self._base_url,
-                params={"result_limit": self._result_limit, "offset": offset},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            hits = data.get("jobs", [])
-            for item in hits:
-                id_icims = item.get("id_icims", "")
-                title = item.get("title", "")
-                location = item.get("normalized_location", item.get("location", ""))
-                job_path = item.get("job_path", "")
-                url = f"https://www.amazon.jobs{job_path}" if job_path else ""
-
-                description = item.get("description_short", "")
-                snippet = _strip_html(description)
-
-                raw_id = f"amazon:{id_icims}"
-                uid = Job.generate_uid(self.source_group, raw_id=raw_id)
-
-                jobs.append(
-                    Job(
-                        uid=uid,
-                        source_group=self.source_group,
-                        source_name=self.source_name,
-                        title=title,
-                        company=self._config.get("company", "Amazon"),
-                        location=location,
-                        url=url,
-                        snippet=snippet,
-                        raw_id=raw_id,
-                    )
-                )
-
-            total = data.get("hits", 0)
-            offset += self._result_limit
-            if offset >= total or not hits:
-                break
+        # The first page tells us the total; the remaining pages are then
+        # independent and fetched concurrently.
+        data = self._fetch_page(0)
+        hits = data.get("jobs", [])
+        jobs = self._parse_hits(hits)
+        if not hits:
+            return jobs
+
+        total = data.get("hits", 0)
+        offsets = range(self._result_limit, total, self._result_limit)
+        if not offsets:
+            return jobs
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(offsets))) as executor:
+            for page in executor.map(self._fetch_page, offsets):
+                jobs.extend(self._parse_hits(page.get("jobs", [])))
 
         return jobs
 
-
-def _strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    def _fetch_page(self, offset: int) -> dict:
+        """Fetch one page of search results starting at offset."""
+        resp = resilient_get(
+            self._base_url,
+            params={"result_limit": self._result_limit, "offset": offset},
+        )
+        check_status(resp)
+        return parse_json(resp)
+
+    def _parse_hits(self, hits: list[dict]) -> list[Job]:
+        """Convert one page of search hits to Jobs.
+
+        Each field is pulled out as a column first, then rows are zipped
+        into Job objects.
+        """
+        raw_ids = [f"amazon:{h.get('id_icims', '')}" for h in hits]
+        titles = [h.get("title", "") for h in hits]
+        locations = [h.get("normalized_location", h.get("location", "")) for h in hits]
+        urls = [
+            f"https://www.amazon.jobs{path}" if path else ""
+            for path in (h.get("job_path", "") for h in hits)
+        ]
+        snippets = [strip_html(h.get("description_short", "")) for h in hits]
+
+        source_group = self.source_group
+        source_name = self.source_name
+        company = self._config.get("company", "Amazon")
+        return [
+            Job(
+                uid=Job.generate_uid(source_group, raw_id=raw_id),
+                source_group=source_group,
+                source_name=source_name,
+                title=title,
+                company=company,
+                location=location,
+                url=url,
+                snippet=snippet,
+                raw_id=raw_id,
+            )
+            for raw_id, title, location, url, snippet in zip(
+                raw_ids, titles, locations, urls, snippets
+            )
+        ]
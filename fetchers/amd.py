@@ -26,10 +26,10 @@ Key Fields per job (inside data dict):
 """
 
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, parse_json, resilient_get, strip_html, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -37,6 +37,9 @@ logger = logging.getLogger(__name__)
 AMD_API_URL = "https://careers.amd.com/api/jobs"
 AMD_CAREERS_BASE = "https://careers.amd.com/careers-home/jobs"
 
+# Number of result pages requested concurrently
+PAGE_WINDOW = 8
+
 
 class AMDFetcher(BaseFetcher):
     """Fetcher for AMD careers using their Jibe/iCIMS JSON API."""
@@ -72,6 +75,9 @@ class AMDFetcher(BaseFetcher):
     def _fetch_category(self, category: str | None) -> list[Job]:
         """Fetch all jobs for a given category, handling pagination.
 
+        Pages are requested PAGE_WINDOW at a time; the window that contains
+        an empty or short page is the last one.
+
         Args:
             category: Category name (e.g. "Engineering") or None for all.
 
@@ -81,43 +87,50 @@ class AMDFetcher(BaseFetcher):
         jobs = []
         page = 1
 
-        while page <= self._max_pages:
-            params: dict = {"page": page}
-
-            if category:
-                params["categories"] = category
-                logger.debug(
-                    "AMD: fetching category=%s page=%d", category, page
-                )
-            else:
-                logger.debug("AMD: fetching all jobs page=%d", page)
-
-            resp = resilient_get(
-                AMD_API_URL,
-                params=params,
-                headers={"Accept": "application/json"},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            job_list = data.get("jobs", [])
-            if not job_list:
-                logger.debug("AMD: empty page %d, stopping", page)
-                break
-
-            for item in job_list:
-                job = self._parse_job(item)
-                if job:
-                    jobs.append(job)
-
-            # If fewer than expected, likely the last page
-            if len(job_list) < self._page_size:
-                break
-
-            page += 1
+        with ThreadPoolExecutor(max_workers=PAGE_WINDOW) as executor:
+            while page <= self._max_pages:
+                window = range(page, min(page + PAGE_WINDOW, self._max_pages + 1))
+                futures = [
+                    executor.submit(self._fetch_page, category, p) for p in window
+                ]
+
+                for p, future in zip(window, futures):
+                    job_list = future.result()
+                    if not job_list:
+                        logger.debug("AMD: empty page %d, stopping", p)
+                        return jobs
+
+                    for item in job_list:
+                        job = self._parse_job(item)
+                        if job:
+                            jobs.append(job)
+
+                    # If fewer than expected, likely the last page
+                    if len(job_list) < self._page_size:
+                        return jobs
+
+                page = window.stop
 
         return jobs
 
+    def _fetch_page(self, category: str | None, page: int) -> list[dict]:
+        """Fetch a single results page and return its raw jobs array."""
+        params: dict = {"page": page}
+
+        if category:
+            params["categories"] = category
+            logger.debug("AMD: fetching category=%s page=%d", category, page)
+        else:
+            logger.debug("AMD: fetching all jobs page=%d", page)
+
+        resp = resilient_get(
+            AMD_API_URL,
+            params=params,
+            headers={"Accept": "application/json"},
+        )
+        check_status(resp)
+        return parse_json(resp).get("jobs", [])
+
     def _parse_job(self, item: dict) -> Job | None:
         """Parse a single job entry from the API response.
 
@@ -157,17 +170,15 @@ class AMDFetcher(BaseFetcher):
             job_data.get("description", "")
             or job_data.get("qualifications", "")
         )
-        snippet = _strip_html(description)
+        snippet = strip_html(description)
 
         # Parse posted date
         posted_at = None
         posted_date = job_data.get("posted_date")
         if posted_date:
             try:
-                posted_at = datetime.fromisoformat(
-                    posted_date.replace("Z", "+00:00")
-                )
-            except (ValueError, AttributeError):
+                posted_at = datetime.fromisoformat(posted_date)
+            except (ValueError, TypeError):
                 pass
 
         # Extract category tags
@@ -198,10 +209,3 @@ class AMDFetcher(BaseFetcher):
             raw_id=raw_id,
             tags=tags,
         )
-
-
-def _strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
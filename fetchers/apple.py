@@ -2,11 +2,10 @@
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
-import requests
-
-from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT
+from fetchers.base import BaseFetcher, check_status, resilient_get
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -14,6 +13,20 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://jobs.apple.com"
 SEARCH_URL = "https://jobs.apple.com/en-us/search"
 
+# Number of search pages requested concurrently
+PAGE_WINDOW = 8
+
+# Job link: /en-us/details/{id}/{slug}?team={team}
+# ID can be like "200644589-0836" or "114438158"
+_APPLE_JOB_RE = re.compile(r'/en-us/details/(\d+(?:-\d+)?)/([^"?/]+)(?:\?team=(\w+))?')
+# Pagination link; group 1 is the page number it points to
+_PAGE_LINK_RE = re.compile(r'[?&]page=(\d+)["\']')
+
+_HTML_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
 # Team code to name mapping
 TEAM_CODES = {
     "SFTWR": "Software and Services",
@@ -28,6 +41,24 @@ TEAM_CODES = {
 }
 
 
+# Slug words that should not be plain title-cased
+_ABBREVIATIONS = {
+    "swe": "SWE",
+    "soc": "SoC",
+    "os": "OS",
+    "ai": "AI",
+    "ml": "ML",
+    "qa": "QA",
+    "ui": "UI",
+    "ux": "UX",
+    "cpu": "CPU",
+    "gpu": "GPU",
+    "io": "I/O",
+    "hwe": "HWE",
+    "sr": "Sr.",
+}
+
+
 class AppleFetcher(BaseFetcher):
     source_group = "maang"
 
@@ -36,53 +67,57 @@ class AppleFetcher(BaseFetcher):
         self._max_pages = source_config.get("max_pages", 250)  # ~4500 US jobs
 
     def fetch(self) -> list[Job]:
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": USER_AGENT,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        })
-
         jobs = []
         seen_ids = set()
         page = 1
 
-        while page <= self._max_pages:
-            try:
-                params = {"location": "united-states-USA", "page": page}
-                resp = session.get(SEARCH_URL, params=params, timeout=DEFAULT_TIMEOUT)
-                resp.raise_for_status()
-            except Exception as e:
-                logger.warning("Apple: failed to fetch page %d: %s", page, e)
-                break
+        # Pages are requested PAGE_WINDOW at a time and parsed in order, so
+        # seen_ids is only touched from this thread.
+        with ThreadPoolExecutor(max_workers=PAGE_WINDOW) as executor:
+            while page <= self._max_pages:
+                window = range(page, min(page + PAGE_WINDOW, self._max_pages + 1))
+                futures = [executor.submit(self._fetch_page, p) for p in window]
 
-            # Parse job links from HTML
-            page_jobs = self._parse_jobs_from_html(resp.text, seen_ids)
+                for p, future in zip(window, futures):
+                    try:
+                        html = future.result()
+                    except Exception as e:
+                        logger.warning("Apple: failed to fetch page %d: %s", p, e)
+                        return jobs
 
-            if not page_jobs:
-                # No jobs on this page, we're done
-                break
+                    # Parse job links from HTML
+                    page_jobs = self._parse_jobs_from_html(html, seen_ids)
 
-            jobs.extend(page_jobs)
+                    if not page_jobs:
+                        # No jobs on this page, we're done
+                        return jobs
 
-            # Check if there's a next page link
-            if not self._has_next_page(resp.text, page):
-                break
+                    jobs.extend(page_jobs)
 
-            page += 1
+                    # Check if there's a next page link
+                    if not self._has_next_page(html, p):
+                        return jobs
+
+                page = window.stop
 
         return jobs
 
+    def _fetch_page(self, page: int) -> str:
+        """Fetch one search results page and return its HTML."""
+        params = {"location": "united-states-USA", "page": page}
+        resp = resilient_get(SEARCH_URL, params=params, headers=_HTML_HEADERS)
+        check_status(resp)
+        return resp.text
+
     def _parse_jobs_from_html(self, html: str, seen_ids: set) -> list[Job]:
         """Extract job listings from HTML content."""
         jobs = []
 
-        # Pattern: /en-us/details/{id}/{slug}?team={team}
-        # ID can be like "200644589-0836" or "114438158"
-        pattern = r'/en-us/details/(\d+(?:-\d+)?)/([^"?/]+)(?:\?team=(\w+))?'
-        matches = re.findall(pattern, html)
+        # Cheap substring check before running the regex over the whole page
+        if "/en-us/details/" not in html:
+            return jobs
 
-        for job_id, slug, team_code in matches:
+        for job_id, slug, team_code in _APPLE_JOB_RE.findall(html):
             # Skip duplicates and locationPicker links
             if job_id in seen_ids or "locationPicker" in slug:
                 continue
@@ -123,34 +158,13 @@ class AppleFetcher(BaseFetcher):
     def _has_next_page(self, html: str, current_page: int) -> bool:
         """Check if there's a next page of results."""
         # Look for pagination links
-        next_page = current_page + 1
-        next_pattern = rf'[?&]page={next_page}["\']'
-        return bool(re.search(next_pattern, html))
+        next_page = str(current_page + 1)
+        if f"page={next_page}" not in html:
+            return False
+        return any(m.group(1) == next_page for m in _PAGE_LINK_RE.finditer(html))
 
 
 def _slug_to_title(slug: str) -> str:
     """Convert URL slug to readable title."""
-    # Replace hyphens with spaces and title case
-    title = slug.replace("-", " ")
-    # Capitalize properly
-    title = title.title()
-    # Fix common abbreviations
-    replacements = {
-        " Swe ": " SWE ",
-        " Soc ": " SoC ",
-        " Os ": " OS ",
-        " Ai ": " AI ",
-        " Ml ": " ML ",
-        " Qa ": " QA ",
-        " Ui ": " UI ",
-        " Ux ": " UX ",
-        " Cpu ": " CPU ",
-        " Gpu ": " GPU ",
-        " Io ": " I/O ",
-        " Hwe ": " HWE ",
-        " Sr ": " Sr. ",
-        " Siri ": " Siri ",  # Ensure Siri stays capitalized
-    }
-    for old, new in replacements.items():
-        title = title.replace(old, new)
-    return title.strip()
+    # Title-case each hyphen-separated word, fixing common abbreviations
+    return " ".join(_ABBREVIATIONS.get(t.lower(), t.title()) for t in slug.split("-") if t)
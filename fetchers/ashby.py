@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, parse_json, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -22,8 +22,8 @@ class AshbyFetcher(BaseFetcher):
     def fetch(self) -> list[Job]:
         url = f"https://api.ashbyhq.com/posting-api/job-board/{self._clientname}"
         resp = resilient_get(url)
-        resp.raise_for_status()
-        data = resp.json()
+        check_status(resp)
+        data = parse_json(resp)
 
         jobs = []
         for item in data.get("jobs", []):
@@ -31,8 +31,8 @@ class AshbyFetcher(BaseFetcher):
             published = item.get("publishedAt")
             if published:
                 try:
-                    posted_at = datetime.fromisoformat(published.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
+                    posted_at = datetime.fromisoformat(published)
+                except (ValueError, TypeError):
                     pass
 
             uid = Job.generate_uid(self.source_group, raw_id=item.get("id", ""))
@@ -1,24 +1,52 @@
 """Abstract base fetcher and resilient HTTP helpers."""
 
 import logging
+import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from html import unescape
 
+import orjson
 import requests
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
 
 from models import Job
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional; fall back to regex stripping
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
 USER_AGENT = "job-notification-discord/0.1 (github.com/ncurl/job-notification-discord)"
 DEFAULT_TIMEOUT = 15
 
 
+def _build_session() -> requests.Session:
+    """Create a pooled Session so repeat requests reuse keep-alive connections."""
+    session = requests.Session()
+    # Retries are handled by _request_with_retry below, not by urllib3
+    adapter = HTTPAdapter(max_retries=0, pool_connections=32, pool_maxsize=32)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["User-Agent"] = USER_AGENT
+    # Advertises br when brotli is installed (it's a declared dependency);
+    # large JSON payloads such as JPMorgan's compress much better with it
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING
+    return session
+
+
+# Shared by all fetchers (and their worker threads) for connection pooling
+_SESSION = _build_session()
+
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
 class BaseFetcher(ABC):
     """Abstract base class for job fetchers."""
 
@@ -48,46 +76,141 @@ class BaseFetcher(ABC):
             return []
 
 
-@retry(
-    retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout)),
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=15),
-    reraise=True,
-)
+def check_status(resp: requests.Response) -> None:
+    """Raise HTTPError for a 4xx/5xx response.
+
+    Equivalent to resp.raise_for_status(), but the happy path is a single
+    integer comparison and the error message is only built when raising.
+    """
+    if resp.status_code >= 400:
+        raise requests.HTTPError(f"{resp.status_code} Error for url: {resp.url}", response=resp)
+
+
+def parse_json(resp: requests.Response):
+    """Decode a JSON response body with orjson (much faster than resp.json())."""
+    return orjson.loads(resp.content)
+
+
+def strip_html(html: str) -> str:
+    """Remove HTML tags, decode entities and collapse whitespace."""
+    if not html:
+        return ""
+    if "<" not in html and "&" not in html:
+        # Plain text: nothing to parse, just collapse whitespace
+        return " ".join(html.split())
+    if LexborHTMLParser is not None:
+        text = LexborHTMLParser(html).text(separator=" ")
+    else:
+        text = unescape(_TAG_RE.sub(" ", html))
+    return " ".join(text.split())
+
+
+def run_all_fetchers(fetchers: list[BaseFetcher], max_workers: int = 32) -> list[Job]:
+    """Run safe_fetch() for every fetcher concurrently and return all jobs.
+
+    Fetchers are I/O bound, so a cycle takes roughly as long as the slowest
+    source instead of the sum of all of them. Results keep fetcher order.
+    """
+    if not fetchers:
+        return []
+
+    jobs: list[Job] = []
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(fetchers))) as executor:
+        for fetched in executor.map(lambda f: f.safe_fetch(), fetchers):
+            jobs.extend(fetched)
+    return jobs
+
+
+# Attempts per request before giving up on connection errors/timeouts/5xx,
+# with exponential backoff clamped to [RETRY_MIN_WAIT, RETRY_MAX_WAIT] seconds
+RETRY_ATTEMPTS = 3
+RETRY_MIN_WAIT = 2
+RETRY_MAX_WAIT = 15
+
+
+def _request_with_retry(session: requests.Session, method: str, url: str, **kwargs) -> requests.Response:
+    """Send a request, retrying connection errors, timeouts and 5xx with backoff.
+
+    A plain loop rather than tenacity: the happy path (first attempt succeeds)
+    runs on nearly every request, and this keeps it to a single call.
+    """
+    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
+    for attempt in range(RETRY_ATTEMPTS):
+        try:
+            resp = session.request(method, url, **kwargs)
+            if resp.status_code >= 500:
+                raise requests.ConnectionError(f"Server error {resp.status_code} from {url}")
+            return resp
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt == RETRY_ATTEMPTS - 1:
+                raise
+            time.sleep(max(RETRY_MIN_WAIT, min(RETRY_MAX_WAIT, 2**attempt)))
+
+
 def resilient_get(url: str, **kwargs) -> requests.Response:
     """GET with retry on connection errors and timeouts."""
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    kwargs.setdefault("headers", {})
-    kwargs["headers"].setdefault("User-Agent", USER_AGENT)
-    resp = requests.get(url, **kwargs)
-    if resp.status_code >= 500:
-        raise requests.ConnectionError(f"Server error {resp.status_code} from {url}")
+    return _request_with_retry(_SESSION, "GET", url, **kwargs)
+
+
+# Bodies are kept in memory, so only the most recently used URLs are cached
+VALIDATOR_CACHE_SIZE = 128
+_REPLAYED_HEADERS = ("Content-Type", "Content-Encoding")
+
+# Prepared URL -> (ETag, Last-Modified, body, replayed headers) of the last 200
+# from conditional_get, in least- to most-recently-used order
+_validator_cache: OrderedDict[str, tuple[str | None, str | None, bytes, dict[str, str]]] = OrderedDict()
+_validator_lock = threading.Lock()
+
+
+def conditional_get(url: str, **kwargs) -> requests.Response:
+    """GET that revalidates with If-None-Match/If-Modified-Since.
+
+    When the server answers 304 the previous body is replayed as a 200, so
+    callers parse it exactly as before but the payload isn't re-downloaded.
+    """
+    prepared = requests.PreparedRequest()
+    prepared.prepare_url(url, kwargs.get("params"))
+    key = prepared.url
+
+    with _validator_lock:
+        cached = _validator_cache.get(key)
+        if cached:
+            _validator_cache.move_to_end(key)
+    if cached:
+        etag, last_modified, _, _ = cached
+        headers = dict(kwargs.get("headers") or {})
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        kwargs["headers"] = headers
+
+    resp = resilient_get(url, **kwargs)
+    if resp.status_code == 304 and cached:
+        resp.status_code = 200
+        resp._content = cached[2]
+        # A 304 carries no entity headers; restore the ones from the cached 200
+        resp.headers.update(cached[3])
+    elif resp.status_code == 200:
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        with _validator_lock:
+            if etag or last_modified:
+                replayed = {h: resp.headers[h] for h in _REPLAYED_HEADERS if h in resp.headers}
+                _validator_cache[key] = (etag, last_modified, resp.content, replayed)
+                _validator_cache.move_to_end(key)
+                if len(_validator_cache) > VALIDATOR_CACHE_SIZE:
+                    _validator_cache.popitem(last=False)
+            else:
+                _validator_cache.pop(key, None)
     return resp
 
 
-@retry(
-    retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout)),
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=15),
-    reraise=True,
-)
 def resilient_post(url: str, **kwargs) -> requests.Response:
     """POST with retry on connection errors and timeouts."""
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
-    kwargs.setdefault("headers", {})
-    kwargs["headers"].setdefault("User-Agent", USER_AGENT)
-    resp = requests.post(url, **kwargs)
-    if resp.status_code >= 500:
-        raise requests.ConnectionError(f"Server error {resp.status_code} from {url}")
-    return resp
+    return _request_with_retry(_SESSION, "POST", url, **kwargs)
 
 
-@retry(
-    retry=retry_if_exception_type((requests.ConnectionError, requests.Timeout)),
-    stop=stop_after_attempt(3),
-    wait=wait_exponential(multiplier=1, min=2, max=15),
-    reraise=True,
-)
 def resilient_session_request(
     session: requests.Session, method: str, url: str, **kwargs
 ) -> requests.Response:
@@ -95,10 +218,32 @@ def resilient_session_request(
 
     Useful for fetchers that need cookie/CSRF persistence (e.g. Apple, Meta).
     """
-    kwargs.setdefault("timeout", DEFAULT_TIMEOUT)
     kwargs.setdefault("headers", {})
     kwargs["headers"].setdefault("User-Agent", USER_AGENT)
-    resp = session.request(method, url, **kwargs)
-    if resp.status_code >= 500:
-        raise requests.ConnectionError(f"Server error {resp.status_code} from {url}")
-    return resp
+    return _request_with_retry(session, method, url, **kwargs)
+
+
+class TokenBucket:
+    """Token bucket allowing `capacity` requests in a burst, refilled at `rate_per_sec`."""
+
+    def __init__(self, rate_per_sec: float, capacity: int = 1):
+        self._rate = rate_per_sec
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take a token. Returns how many seconds to wait before sending (0 if none).
+
+        The token is reserved immediately, so concurrent callers queue up
+        behind each other instead of all waking at once.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
@@ -26,15 +26,31 @@ Implementation Notes:
 - Rate limiting strategy: conservative delays between requests
 """
 
-import json
 import logging
+import math
 import re
+import sys
+import threading
 import time
-from typing import Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from typing import Iterable, Iterator, Optional
 
+import orjson
 import requests
-
-from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT, resilient_post
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+
+from fetchers.base import (
+    BaseFetcher,
+    USER_AGENT,
+    DEFAULT_TIMEOUT,
+    TokenBucket,
+    resilient_session_request,
+    check_status,
+    parse_json,
+)
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -88,6 +104,117 @@ DEFAULT_EXPERIENCES = ["EARLY_CAREER", "PROFESSIONAL"]
 DEFAULT_DIVISIONS = ["Engineering"]
 DEFAULT_EXPERIENCE_LEVELS = ["Analyst", "Summer Analyst", "New Analyst"]
 
+# GraphQL pages fetched after the first one, and how many at once
+DEFAULT_MAX_PAGES = 20
+MAX_WORKERS = 8
+
+# Job URLs: /roles/{numeric_id} or /roles/{numeric_id}/{slug}
+_ROLE_URL_RE = re.compile(r'/roles/(\d+)(?:/([a-z0-9-]+))?', re.IGNORECASE)
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+_INITIAL_STATE_RE = re.compile(r'window\.__INITIAL_STATE__\s*=\s*({.*?});', re.DOTALL)
+_APOLLO_STATE_RE = re.compile(r'window\.__APOLLO_STATE__\s*=\s*({.*?});', re.DOTALL)
+
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# Field names that mark a dict as a job posting in embedded page data
+_JOB_INDICATORS = frozenset({"title", "id", "location", "role", "position", "jobTitle"})
+
+# Lowercase slug word -> display form for _slug_to_title
+_ABBREVIATIONS = {
+    "usa": "USA",
+    "uk": "UK",
+    "nyc": "NYC",
+    "sf": "SF",
+    "la": "LA",
+    "api": "API",
+    "ui": "UI",
+    "ux": "UX",
+    "gs": "GS",
+    "it": "IT",
+    "ai": "AI",
+    "ml": "ML",
+    "swe": "SWE",
+    "qa": "QA",
+    "devops": "DevOps",
+    "ios": "iOS",
+    "macos": "macOS",
+    "aws": "AWS",
+    "gcp": "GCP",
+    "sql": "SQL",
+    "jr": "Jr.",
+    "sr": "Sr.",
+    "vp": "VP",
+}
+
+
+_BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/html",
+    "Accept-Language": "en-US,en;q=0.9",
+    # Includes br only when brotli is installed, so urllib3 can decode what we ask for
+    "Accept-Encoding": ACCEPT_ENCODING,
+    "Referer": "https://www.goldmansachs.com/",
+}
+
+# User-Agent is set explicitly so resilient_session_request never has to add it
+_GRAPHQL_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+}
+
+
+def _build_session() -> requests.Session:
+    """Create the pooled browser-like Session used for all higher.gs.com requests."""
+    session = requests.Session()
+    # Retries are handled per request by resilient_session_request
+    adapter = HTTPAdapter(max_retries=0, pool_connections=4, pool_maxsize=20)
+    session.mount("https://", adapter)
+    session.headers.update(_BROWSER_HEADERS)
+    return session
+
+
+# Shared across fetch() calls so higher.gs.com / api-higher.gs.com connections stay warm
+_GS_SESSION = _build_session()
+
+# Both scraping fallbacks request the same careers page; GraphQL responses are
+# cached briefly so a scheduler re-running fetch() doesn't repeat the query.
+CAREERS_HTML_TTL = 300
+GRAPHQL_TTL = 60
+
+
+class _TTLCache:
+    """Small thread-safe dict cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, ttl: float, maxsize: int = 8):
+        self._ttl = ttl
+        self._maxsize = maxsize
+        self._data: dict = {}
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if time.monotonic() >= expires:
+                del self._data[key]
+                return None
+            return value
+
+    def put(self, key, value) -> None:
+        with self._lock:
+            if len(self._data) >= self._maxsize and key not in self._data:
+                # Evict the entry closest to expiry
+                del self._data[min(self._data, key=lambda k: self._data[k][0])]
+            self._data[key] = (time.monotonic() + self._ttl, value)
+
+
+_careers_html_cache = _TTLCache(CAREERS_HTML_TTL)
+_graphql_cache = _TTLCache(GRAPHQL_TTL)
+
 
 class GoldmanSachsFetcher(BaseFetcher):
     """Fetcher for Goldman Sachs jobs from higher.gs.com.
@@ -103,6 +230,7 @@ class GoldmanSachsFetcher(BaseFetcher):
     - filters: Job filter criteria (divisions, levels, regions)
     - use_graphql: Enable/disable GraphQL fetching (default: True)
     - keywords: Keywords to filter job titles (e.g., ["Software Engineer", "Developer"])
+    - max_pages: Cap on GraphQL pages fetched per run (default: 20)
     """
 
     source_group = "goldmansachs"
@@ -111,9 +239,14 @@ class GoldmanSachsFetcher(BaseFetcher):
         super().__init__(source_config)
         self._graphql_endpoint = source_config.get("graphql_endpoint", GRAPHQL_ENDPOINT)
         self._query = source_config.get("graphql_query", DEFAULT_GRAPHQL_QUERY)
+        # The query text is identical for every page, so JSON-encode it once
+        self._query_json = orjson.dumps(self._query)
         self._use_graphql = source_config.get("use_graphql", True)
         self._keywords = source_config.get("keywords", [])
+        self._keywords_lower = [k.lower() for k in self._keywords]
         self._request_delay = source_config.get("request_delay", 1.0)
+        # Spaces requests request_delay apart across all worker threads
+        self._limiter = TokenBucket(1.0 / self._request_delay) if self._request_delay > 0 else None
 
         # API filter parameters
         self._experiences = source_config.get("experiences", DEFAULT_EXPERIENCES)
@@ -121,6 +254,7 @@ class GoldmanSachsFetcher(BaseFetcher):
         self._experience_levels = source_config.get("experience_levels", DEFAULT_EXPERIENCE_LEVELS)
         self._search_term = source_config.get("search_term", "")
         self._page_size = source_config.get("page_size", 100)  # Max results per page
+        self._max_pages = source_config.get("max_pages", DEFAULT_MAX_PAGES)
 
     def fetch(self) -> list[Job]:
         """Fetch jobs from Goldman Sachs careers site.
@@ -133,14 +267,7 @@ class GoldmanSachsFetcher(BaseFetcher):
         Returns:
             List of Job objects
         """
-        session = requests.Session()
-        session.headers.update({
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36",
-            "Accept": "application/json, text/html",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Referer": "https://www.goldmansachs.com/",
-        })
+        session = _GS_SESSION
 
         jobs = []
 
@@ -187,45 +314,26 @@ class GoldmanSachsFetcher(BaseFetcher):
         browser DevTools by inspecting network requests on higher.gs.com.
         """
         try:
-            # Build GraphQL request payload
-            variables = self._build_query_variables()
-            payload = {
-                "query": self._query,
-                "variables": variables,
-            }
-
-            # Add delay to avoid rate limiting
-            time.sleep(self._request_delay)
-
-            # Use resilient_post for automatic retries
-            resp = resilient_post(
-                self._graphql_endpoint,
-                json=payload,
-                timeout=DEFAULT_TIMEOUT,
-                headers={
-                    "Content-Type": "application/json",
-                    "Accept": "application/json",
-                }
-            )
-
-            if resp.status_code == 404:
-                logger.debug("GoldmanSachs: GraphQL endpoint not found (404). Endpoint may need to be discovered.")
-                return []
-
-            if resp.status_code != 200:
-                logger.warning("GoldmanSachs: GraphQL returned %d: %s", resp.status_code, resp.text[:200])
+            data = self._post_graphql(session, 0)
+            if data is None:
                 return []
 
-            data = resp.json()
+            items = self._extract_jobs_from_graphql(data)
 
-            # Check for GraphQL errors
-            if "errors" in data:
-                logger.warning("GoldmanSachs: GraphQL errors: %s", data["errors"])
-                return []
+            # Fetch the remaining pages concurrently now that totalCount is known
+            role_search = (data.get("data") or {}).get("roleSearch") or {}
+            total_count = role_search.get("totalCount") or 0
+            pages = min(math.ceil(total_count / self._page_size), self._max_pages)
+            if not items or pages <= 1:
+                return list(self._parse_jobs(items))
 
-            # Extract jobs from response (structure depends on actual API)
-            jobs_data = self._extract_jobs_from_graphql(data)
-            return self._parse_jobs(jobs_data)
+            with ThreadPoolExecutor(max_workers=min(pages - 1, MAX_WORKERS)) as executor:
+                # map() yields pages in order as they complete, so earlier pages
+                # are parsed while later ones are still in flight
+                pages_iter = executor.map(
+                    lambda n: self._fetch_graphql_page(session, n), range(1, pages)
+                )
+                return list(self._parse_jobs(chain(items, chain.from_iterable(pages_iter))))
 
         except requests.exceptions.RequestException as e:
             logger.debug("GoldmanSachs: GraphQL request failed: %s", e)
@@ -234,6 +342,59 @@ class GoldmanSachsFetcher(BaseFetcher):
             logger.warning("GoldmanSachs: Unexpected error in GraphQL fetch: %s", e, exc_info=True)
             return []
 
+    def _fetch_graphql_page(self, session: requests.Session, page_number: int) -> list[dict]:
+        """Fetch one follow-up GraphQL page, returning [] on failure so other pages survive."""
+        try:
+            data = self._post_graphql(session, page_number)
+        except Exception as e:
+            logger.warning("GoldmanSachs: GraphQL page %d failed: %s", page_number, e)
+            return []
+        return self._extract_jobs_from_graphql(data) if data else []
+
+    def _post_graphql(self, session: requests.Session, page_number: int) -> Optional[dict]:
+        """POST the role search query for one page. Returns the response JSON, or None on error."""
+        # Build the GraphQL request body around the pre-encoded query
+        body = (
+            b'{"query":' + self._query_json
+            + b',"variables":' + orjson.dumps(self._build_query_variables(page_number))
+            + b"}"
+        )
+        cache_key = (self._graphql_endpoint, body)
+        data = _graphql_cache.get(cache_key)
+        if data is not None:
+            return data
+
+        # Wait for a rate-limit slot
+        self._throttle()
+
+        # Retry transient failures over the pooled session
+        resp = resilient_session_request(
+            session,
+            "POST",
+            self._graphql_endpoint,
+            data=body,
+            timeout=DEFAULT_TIMEOUT,
+            headers=_GRAPHQL_HEADERS,
+        )
+
+        if resp.status_code == 404:
+            logger.debug("GoldmanSachs: GraphQL endpoint not found (404). Endpoint may need to be discovered.")
+            return None
+
+        if resp.status_code != 200:
+            logger.warning("GoldmanSachs: GraphQL returned %d: %s", resp.status_code, resp.text[:200])
+            return None
+
+        data = parse_json(resp)
+
+        # Check for GraphQL errors
+        if "errors" in data:
+            logger.warning("GoldmanSachs: GraphQL errors: %s", data["errors"])
+            return None
+
+        _graphql_cache.put(cache_key, data)
+        return data
+
     def _fetch_via_url_scraping(self, session: requests.Session) -> list[Job]:
         """Fetch jobs by scraping job URLs from the careers page.
 
@@ -247,19 +408,10 @@ class GoldmanSachsFetcher(BaseFetcher):
             # Build URL with filter query params
             params = self._build_url_params()
 
-            time.sleep(self._request_delay)
-
-            resp = session.get(CAREERS_URL, params=params, timeout=30)
-            resp.raise_for_status()
-
-            # Extract job URLs from the page
-            jobs = self._extract_jobs_from_urls(resp.text)
+            html = self._get_careers_html(session, params)
 
-            # Filter by keywords if specified
-            if self._keywords and jobs:
-                jobs = [job for job in jobs if self._matches_keywords(job.title)]
-
-            return jobs
+            # Extract job URLs from the page (keyword filtering happens per URL)
+            return self._extract_jobs_from_urls(html)
 
         except requests.exceptions.RequestException as e:
             logger.debug("GoldmanSachs: URL scraping failed: %s", e)
@@ -275,14 +427,15 @@ class GoldmanSachsFetcher(BaseFetcher):
         - /roles/{job_id}
         - /roles/{job_id}/{slug}
         """
+        # Error and empty pages have no role links; skip the regex scan entirely
+        if "/roles/" not in html:
+            return []
+
         jobs = []
         seen_ids = set()
+        company = sys.intern(self._config.get("company", "Goldman Sachs"))
 
-        # Pattern: /roles/{numeric_id} or /roles/{numeric_id}/{slug}
-        pattern = r'/roles/(\d+)(?:/([a-z0-9-]+))?'
-        matches = re.findall(pattern, html, re.IGNORECASE)
-
-        for job_id, slug in matches:
+        for job_id, slug in _iter_role_links(html):
             if job_id in seen_ids:
                 continue
             seen_ids.add(job_id)
@@ -293,6 +446,10 @@ class GoldmanSachsFetcher(BaseFetcher):
             else:
                 title = f"Goldman Sachs Position {job_id}"
 
+            # Filter by keywords before building the Job
+            if self._keywords_lower and not self._matches_keywords(title):
+                continue
+
             # Build URL
             url = f"{BASE_URL}/roles/{job_id}"
             if slug:
@@ -307,7 +464,7 @@ class GoldmanSachsFetcher(BaseFetcher):
                     source_group=self.source_group,
                     source_name=self.source_name,
                     title=title,
-                    company=self._config.get("company", "Goldman Sachs"),
+                    company=company,
                     location="Multiple Locations",  # Will be updated if we get more data
                     url=url,
                     raw_id=raw_id,
@@ -326,19 +483,38 @@ class GoldmanSachsFetcher(BaseFetcher):
         try:
             # Build URL with filter query params
             params = self._build_url_params()
-            resp = session.get(CAREERS_URL, params=params, timeout=30)
-            resp.raise_for_status()
+            html = self._get_careers_html(session, params)
 
             # Try to extract embedded job data
-            jobs_data = self._extract_embedded_jobs(resp.text)
+            jobs_data = self._extract_embedded_jobs(html)
             if jobs_data:
-                return self._parse_jobs(jobs_data)
+                return list(self._parse_jobs(jobs_data))
 
         except Exception as e:
             logger.warning("GoldmanSachs: Page scraping failed: %s", e)
 
         return []
 
+    def _throttle(self) -> None:
+        if self._limiter:
+            wait = self._limiter.acquire()
+            if wait:
+                time.sleep(wait)
+
+    def _get_careers_html(self, session: requests.Session, params: dict) -> str:
+        """GET the careers page, reusing a cached copy fetched within CAREERS_HTML_TTL."""
+        key = tuple(sorted(params.items()))
+        html = _careers_html_cache.get(key)
+        if html is not None:
+            return html
+
+        self._throttle()
+        resp = session.get(CAREERS_URL, params=params, timeout=30)
+        check_status(resp)
+        html = resp.text
+        _careers_html_cache.put(key, html)
+        return html
+
     def _build_query_variables(self, page_number: int = 0) -> dict:
         """Build GraphQL query variables based on actual API structure.
 
@@ -457,34 +633,29 @@ class GoldmanSachsFetcher(BaseFetcher):
     def _extract_embedded_jobs(self, html: str) -> list[dict]:
         """Extract job data from embedded JSON in page HTML."""
         # Try __NEXT_DATA__ script tag
-        match = re.search(
-            r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>',
-            html,
-            re.DOTALL
-        )
-        if match:
+        match = _NEXT_DATA_RE.search(html)
+        # Jobs can only come from a non-empty initialApolloState; skip parsing
+        # the (often large) blob when it has none
+        if match and _has_apollo_state(match.group(1)):
             try:
-                next_data = json.loads(match.group(1))
+                next_data = orjson.loads(match.group(1))
                 # Try to find jobs in the Next.js data structure
                 jobs = self._find_jobs_in_nextdata(next_data)
                 if jobs:
                     return jobs
-            except json.JSONDecodeError as e:
+            except orjson.JSONDecodeError as e:
                 logger.debug("GoldmanSachs: Failed to parse __NEXT_DATA__: %s", e)
 
         # Try other embedded data patterns
-        for pattern in [
-            r'window\.__INITIAL_STATE__\s*=\s*({.*?});',
-            r'window\.__APOLLO_STATE__\s*=\s*({.*?});',
-        ]:
-            match = re.search(pattern, html, re.DOTALL)
+        for pattern in (_INITIAL_STATE_RE, _APOLLO_STATE_RE):
+            match = pattern.search(html)
             if match:
                 try:
-                    data = json.loads(match.group(1))
+                    data = orjson.loads(match.group(1))
                     jobs = self._find_jobs_in_data(data)
                     if jobs:
                         return jobs
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     continue
 
         return []
@@ -504,21 +675,20 @@ class GoldmanSachsFetcher(BaseFetcher):
         return []
 
     def _find_jobs_in_data(self, data: dict, max_depth: int = 5) -> list[dict]:
-        """Recursively search for job arrays in data structure."""
-        if max_depth <= 0 or not isinstance(data, dict):
-            return []
+        """Breadth-first search for the shallowest job array in a data structure."""
+        queue = deque([(data, 0)])
+        while queue:
+            node, depth = queue.popleft()
+            if depth >= max_depth or not isinstance(node, dict):
+                continue
 
-        # Look for arrays that might be job listings
-        for key, value in data.items():
-            if isinstance(value, list) and value:
-                # Check if this looks like a jobs array
-                if self._looks_like_jobs_array(value):
-                    return value
-            elif isinstance(value, dict):
-                # Recurse into nested objects
-                jobs = self._find_jobs_in_data(value, max_depth - 1)
-                if jobs:
-                    return jobs
+            for value in node.values():
+                if isinstance(value, list) and value:
+                    # Check if this looks like a jobs array
+                    if self._looks_like_jobs_array(value):
+                        return value
+                elif isinstance(value, dict):
+                    queue.append((value, depth + 1))
 
         return []
 
@@ -527,13 +697,12 @@ class GoldmanSachsFetcher(BaseFetcher):
         if not arr or not isinstance(arr[0], dict):
             return False
 
-        first = arr[0]
         # Check for common job field names
-        job_indicators = {"title", "id", "location", "role", "position", "jobTitle"}
-        return bool(job_indicators & set(first.keys()))
+        first = arr[0]
+        return any(key in first for key in _JOB_INDICATORS)
 
-    def _parse_jobs(self, items: list) -> list[Job]:
-        """Parse job items from GraphQL response into Job objects.
+    def _parse_jobs(self, items: Iterable) -> Iterator[Job]:
+        """Lazily parse job items from GraphQL response into Job objects.
 
         Based on actual API response structure:
         {
@@ -553,7 +722,10 @@ class GoldmanSachsFetcher(BaseFetcher):
           "status": "ACTIVE"
         }
         """
-        jobs = []
+        # Loop-invariant Job fields, shared by every Job built below
+        company = sys.intern(self._config.get("company", "Goldman Sachs"))
+        source_group = self.source_group
+        source_name = self.source_name
 
         for item in items:
             if not isinstance(item, dict):
@@ -570,8 +742,8 @@ class GoldmanSachsFetcher(BaseFetcher):
             # Extract title (use jobTitle, fallback to corporateTitle)
             title = item.get("jobTitle") or item.get("corporateTitle") or f"Role {job_id}"
 
-            # Filter by keywords if specified
-            if self._keywords and not self._matches_keywords(title):
+            # Filter by keywords before any of the per-job formatting below
+            if self._keywords_lower and not self._matches_keywords(title):
                 continue
 
             # Extract location from locations object
@@ -584,15 +756,15 @@ class GoldmanSachsFetcher(BaseFetcher):
             # Build snippet from available fields
             snippet_parts = []
 
-            division = item.get("division")
+            division = _intern(item.get("division"))
             if division:
                 snippet_parts.append(f"Division: {division}")
 
-            job_function = item.get("jobFunction")
+            job_function = _intern(item.get("jobFunction"))
             if job_function:
                 snippet_parts.append(f"Function: {job_function}")
 
-            corporate_title = item.get("corporateTitle")
+            corporate_title = _intern(item.get("corporateTitle"))
             if corporate_title:
                 snippet_parts.append(f"Level: {corporate_title}")
 
@@ -608,7 +780,7 @@ class GoldmanSachsFetcher(BaseFetcher):
 
             # Generate UID
             raw_id = f"goldmansachs:{job_id}"
-            uid = Job.generate_uid(self.source_group, raw_id=raw_id)
+            uid = Job.generate_uid(source_group, raw_id=raw_id)
 
             # Build tags from metadata
             tags = []
@@ -619,24 +791,20 @@ class GoldmanSachsFetcher(BaseFetcher):
             if corporate_title:
                 tags.append(corporate_title)
 
-            jobs.append(
-                Job(
-                    uid=uid,
-                    source_group=self.source_group,
-                    source_name=self.source_name,
-                    title=title,
-                    company=self._config.get("company", "Goldman Sachs"),
-                    location=location,
-                    remote=remote,
-                    url=url,
-                    snippet=snippet,
-                    raw_id=raw_id,
-                    tags=tags,
-                )
+            yield Job(
+                uid=uid,
+                source_group=source_group,
+                source_name=source_name,
+                title=title,
+                company=company,
+                location=location,
+                remote=remote,
+                url=url,
+                snippet=snippet,
+                raw_id=raw_id,
+                tags=tags,
             )
 
-        return jobs
-
     def _format_location(self, location_data) -> str:
         """Format location data into a readable string.
 
@@ -653,95 +821,64 @@ class GoldmanSachsFetcher(BaseFetcher):
         if isinstance(location_data, str):
             return location_data
 
-        if isinstance(location_data, list):
-            # Handle array of locations (actual API structure)
-            locations = []
-            for loc in location_data:
-                if isinstance(loc, str):
-                    locations.append(loc)
-                elif isinstance(loc, dict):
-                    # Build location string from city, state, country
-                    parts = []
-                    city = loc.get("city")
-                    state = loc.get("state")
-                    country = loc.get("country")
-
-                    if city:
-                        parts.append(city)
-                    # Only add state if it's different from city (avoid "New York, New York")
-                    if state and state != city:
-                        # Skip state if it's already in the city string
-                        if not (city and state in city):
-                            parts.append(state)
-                    if country:
-                        parts.append(country)
-
-                    if parts:
-                        locations.append(", ".join(parts))
-
-            # Prioritize primary location if multiple locations exist
-            if len(locations) > 1:
-                # Find primary location
-                for i, loc in enumerate(location_data):
-                    if isinstance(loc, dict) and loc.get("primary"):
-                        # Move primary to front
-                        primary_str = locations[i]
-                        return primary_str + (f" +{len(locations)-1} more" if len(locations) > 1 else "")
-
-            return " | ".join(locations[:3])  # Limit to 3 locations
-
         if isinstance(location_data, dict):
             # Single location object (fallback)
-            parts = []
-            city = location_data.get("city")
-            state = location_data.get("state")
-            country = location_data.get("country")
-
-            if city:
-                parts.append(city)
-            if state and state != city:
-                parts.append(state)
-            if country:
-                parts.append(country)
+            return _format_one_location(location_data)
 
-            return ", ".join(parts) if parts else ""
+        if not isinstance(location_data, list):
+            return ""
 
-        return ""
+        # Fast path: nearly every posting has exactly one location
+        if len(location_data) == 1:
+            loc = location_data[0]
+            if isinstance(loc, str):
+                return loc
+            return _format_one_location(loc) if isinstance(loc, dict) else ""
+
+        locations = []
+        primary = None
+        for loc in location_data:
+            if isinstance(loc, str):
+                locations.append(loc)
+            elif isinstance(loc, dict):
+                text = _format_one_location(loc)
+                if text:
+                    locations.append(text)
+                    if primary is None and loc.get("primary"):
+                        primary = text
+
+        # Prioritize primary location if multiple locations exist
+        if primary and len(locations) > 1:
+            return f"{primary} +{len(locations) - 1} more"
+
+        return " | ".join(locations[:3])  # Limit to 3 locations
 
     def _is_remote(self, item: dict) -> bool:
         """Determine if a job is remote.
 
         Check locations object and job type for remote indicators.
         """
-        # Check job type
-        job_type = item.get("jobType", {})
+        # Job type description and location strings, lowercased in one go
+        parts = []
+        job_type = item.get("jobType")
         if isinstance(job_type, dict):
-            description = job_type.get("description", "").lower()
-            if "remote" in description or "virtual" in description:
-                return True
-
-        # Check locations
-        locations = item.get("locations", {})
+            parts.append(job_type.get("description") or "")
+        locations = item.get("locations")
         if isinstance(locations, dict):
-            for key, value in locations.items():
-                if isinstance(value, str):
-                    value_lower = value.lower()
-                    if "remote" in value_lower or "virtual" in value_lower:
-                        return True
-
-        # Check title
-        title = item.get("jobTitle", "").lower()
-        if "remote" in title:
+            parts.extend(v for v in locations.values() if isinstance(v, str))
+        text = " ".join(parts).lower()
+        if "remote" in text or "virtual" in text:
             return True
 
-        return False
+        # Check title
+        return "remote" in (item.get("jobTitle") or "").lower()
 
     def _matches_keywords(self, title: str) -> bool:
         """Check if title matches any of the configured keywords."""
-        if not self._keywords:
+        if not self._keywords_lower:
             return True
         title_lower = title.lower()
-        return any(keyword.lower() in title_lower for keyword in self._keywords)
+        return any(keyword in title_lower for keyword in self._keywords_lower)
 
     def _clean_text(self, text: str) -> str:
         """Clean HTML and extra whitespace from text."""
@@ -749,9 +886,9 @@ class GoldmanSachsFetcher(BaseFetcher):
             return ""
 
         # Remove HTML tags
-        text = re.sub(r"<[^>]+>", " ", text)
+        text = _HTML_TAG_RE.sub(" ", text)
         # Collapse whitespace
-        text = re.sub(r"\s+", " ", text)
+        text = _WS_RE.sub(" ", text)
         # Truncate to reasonable length
         text = text.strip()
         if len(text) > 300:
@@ -760,6 +897,43 @@ class GoldmanSachsFetcher(BaseFetcher):
         return text
 
 
+def _iter_role_links(html: str) -> Iterator[tuple[str, str]]:
+    """Yield (job_id, slug) for each role link in the page (slug may be "").
+
+    A single regex pass over the page covers both anchors and embedded JSON;
+    parsing the DOM first measured several times slower even on large pages.
+    """
+    for match in _ROLE_URL_RE.finditer(html):
+        yield match.group(1), match.group(2) or ""
+
+
+def _format_one_location(loc: dict) -> str:
+    """Format one {city, state, country} location as "City, State, Country"."""
+    city = loc.get("city")
+    state = loc.get("state")
+    country = loc.get("country")
+
+    # Skip state when it repeats the city (avoid "New York, New York")
+    if state and city and state in city:
+        state = None
+    return ", ".join([p for p in (city, state, country) if p])
+
+
+def _has_apollo_state(next_data: str) -> bool:
+    """Cheap textual check for a non-empty initialApolloState in __NEXT_DATA__."""
+    idx = next_data.find('"initialApolloState"')
+    if idx == -1:
+        return False
+    # Higher currently ships `"initialApolloState":{}` and loads jobs client-side
+    rest = next_data[idx + 20:idx + 64].replace(" ", "")
+    return not rest.startswith((":{}", ":null"))
+
+
+def _intern(value):
+    """Intern string metadata (division, level, ...) that repeats across many jobs."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
 def _slug_to_title(slug: str) -> str:
     """Convert URL slug to readable title.
 
@@ -769,43 +943,9 @@ def _slug_to_title(slug: str) -> str:
     Returns:
         Human-readable title (e.g., "Software Engineer New Grad")
     """
-    if not slug:
-        return ""
-
-    # Replace hyphens and underscores with spaces
-    title = slug.replace("-", " ").replace("_", " ")
-
-    # Title case
-    title = title.title()
-
-    # Fix common abbreviations and acronyms
-    replacements = {
-        " Usa ": " USA ",
-        " Uk ": " UK ",
-        " Nyc ": " NYC ",
-        " Sf ": " SF ",
-        " La ": " LA ",
-        " Api ": " API ",
-        " Ui ": " UI ",
-        " Ux ": " UX ",
-        " Gs ": " GS ",
-        " It ": " IT ",
-        " Ai ": " AI ",
-        " Ml ": " ML ",
-        " Swe ": " SWE ",
-        " Qa ": " QA ",
-        " Devops ": " DevOps ",
-        " Ios ": " iOS ",
-        " Macos ": " macOS ",
-        " Aws ": " AWS ",
-        " Gcp ": " GCP ",
-        " Sql ": " SQL ",
-        " Jr ": " Jr. ",
-        " Sr ": " Sr. ",
-        " Vp ": " VP ",
-    }
-
-    for old, new in replacements.items():
-        title = title.replace(old, new)
-
-    return title.strip()
+    # Title-case each word, fixing common abbreviations and acronyms in the same pass
+    return " ".join(
+        _ABBREVIATIONS.get(t.lower(), t.title())
+        for t in slug.replace("_", "-").split("-")
+        if t
+    )
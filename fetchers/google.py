@@ -1,10 +1,19 @@
 """Fetcher for Google Careers XML feed."""
 
+import functools
 import logging
-import re
-import xml.etree.ElementTree as ET
 
-from fetchers.base import BaseFetcher, resilient_get
+try:
+    # libxml2-backed parser; much faster than ElementTree on the multi-MB feed
+    from lxml import etree as ET
+
+    _HAS_LXML = True
+except ImportError:  # lxml is optional; the stdlib parser has the same find/iterparse API
+    import xml.etree.ElementTree as ET
+
+    _HAS_LXML = False
+
+from fetchers.base import BaseFetcher, resilient_get, check_status, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -12,7 +21,7 @@ logger = logging.getLogger(__name__)
 FEED_URL = "https://www.google.com/about/careers/applications/jobs/feed.xml"
 
 # Countries to include (US, Canada, Western Europe)
-ALLOWED_COUNTRIES = {
+ALLOWED_COUNTRIES = frozenset({
     # North America
     "US", "USA", "United States",
     "CA", "Canada",
@@ -33,7 +42,7 @@ ALLOWED_COUNTRIES = {
     "PT", "Portugal",
     "IT", "Italy",
     "LU", "Luxembourg",
-}
+})
 
 
 class GoogleFetcher(BaseFetcher):
@@ -42,19 +51,22 @@ class GoogleFetcher(BaseFetcher):
     def __init__(self, source_config: dict):
         super().__init__(source_config)
         self._feed_url = source_config.get("feed_url", FEED_URL)
-        self._allowed_countries = source_config.get("allowed_countries", ALLOWED_COUNTRIES)
+        self._allowed_countries = frozenset(source_config.get("allowed_countries", ALLOWED_COUNTRIES))
 
     def fetch(self) -> list[Job]:
-        resp = resilient_get(self._feed_url, timeout=60)
-        resp.raise_for_status()
-
-        root = ET.fromstring(resp.content)
-
+        # Stream the feed so only one <job> subtree is alive at a time
+        resp = resilient_get(self._feed_url, timeout=60, stream=True)
+        with resp:
+            check_status(resp)
+            resp.raw.decode_content = True
+            return self._parse_jobs(resp.raw)
+
+    def _parse_jobs(self, source) -> list[Job]:
         jobs = []
-        for item in root.iter("job"):
+        for item in _iter_job_elements(source):
             # Filter by location country
-            countries = _get_countries(item)
-            if not _has_allowed_country(countries, self._allowed_countries):
+            locations = _location_tuples(item)
+            if self._allowed_countries.isdisjoint(country for _, _, country in locations):
                 continue
 
             job_id = _text(item, "jobid")
@@ -62,10 +74,10 @@ class GoogleFetcher(BaseFetcher):
             employer = _text(item, "employer")
             company = employer if employer else self._config.get("company", "Google")
             description = _text(item, "description")
-            snippet = _strip_html(description)
+            snippet = strip_html(description)
             url = _text(item, "url")
 
-            location = _build_location(item)
+            location = _build_location(locations)
 
             raw_id = f"google:{job_id}"
             uid = Job.generate_uid(self.source_group, raw_id=raw_id)
@@ -87,53 +99,48 @@ class GoogleFetcher(BaseFetcher):
         return jobs
 
 
+def _iter_job_elements(source):
+    """Yield each <job> element as it closes, then free it."""
+    if _HAS_LXML:
+        for _, elem in ET.iterparse(
+            source, events=("end",), tag="job", resolve_entities=False, no_network=True
+        ):
+            yield elem
+            elem.clear()
+            # Drop already-processed siblings still referenced by the root
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _, elem in ET.iterparse(source, events=("end",)):
+            if elem.tag == "job":
+                yield elem
+                elem.clear()
+
+
 def _text(element: ET.Element, tag: str) -> str:
     """Get text content of a child element, or empty string."""
     child = element.find(tag)
     return child.text.strip() if child is not None and child.text else ""
 
 
-def _get_countries(item: ET.Element) -> list[str]:
-    """Extract list of country values from item's locations."""
-    countries = []
+def _location_tuples(item: ET.Element) -> tuple[tuple[str, str, str], ...]:
+    """Read (city, state, country) for each <location> in one walk of the subtree."""
     locations_el = item.find("locations")
     if locations_el is None:
-        return countries
-    for loc in locations_el.findall("location"):
-        country = _text(loc, "country")
-        if country:
-            countries.append(country)
-    return countries
-
-
-def _has_allowed_country(countries: list[str], allowed: set[str]) -> bool:
-    """Check if any country in the list is in the allowed set."""
-    if not countries:
-        return False
-    for country in countries:
-        if country in allowed:
-            return True
-    return False
-
-
-def _build_location(item: ET.Element) -> str:
-    """Build a location string from nested <locations> structure."""
+        return ()
+    return tuple(
+        (_text(loc, "city"), _text(loc, "state"), _text(loc, "country"))
+        for loc in locations_el.findall("location")
+    )
+
+
+# Many jobs share the same handful of location sets, so formatting is memoized
+@functools.lru_cache(maxsize=4096)
+def _build_location(locations: tuple) -> str:
+    """Build a location string from (city, state, country) tuples."""
     parts = []
-    locations_el = item.find("locations")
-    if locations_el is None:
-        return ""
-    for loc in locations_el.findall("location"):
-        city = _text(loc, "city")
-        state = _text(loc, "state")
-        country = _text(loc, "country")
-        loc_parts = [p for p in (city, state, country) if p]
+    for loc in locations:
+        loc_parts = [p for p in loc if p]
         if loc_parts:
             parts.append(", ".join(loc_parts))
     return " | ".join(parts)
-
-
-def _strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
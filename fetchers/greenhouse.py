@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, parse_json, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -22,8 +22,14 @@ class GreenhouseFetcher(BaseFetcher):
     def fetch(self) -> list[Job]:
         url = f"https://boards-api.greenhouse.io/v1/boards/{self._board_token}/jobs?content=true"
         resp = resilient_get(url)
-        resp.raise_for_status()
-        data = resp.json()
+        check_status(resp)
+        data = parse_json(resp)
+
+        # Loop-invariant fields, bound once
+        source_group = self.source_group
+        source_name = self.source_name
+        company = self._config.get("company", self._board_token)
+        generate_uid = Job.generate_uid
 
         jobs = []
         for item in data.get("jobs", []):
@@ -31,32 +37,29 @@ class GreenhouseFetcher(BaseFetcher):
             updated_at = item.get("updated_at")
             if updated_at:
                 try:
-                    posted_at = datetime.fromisoformat(updated_at.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
+                    # Python 3.11's C fromisoformat accepts a trailing "Z" directly
+                    posted_at = datetime.fromisoformat(updated_at)
+                except (ValueError, TypeError):
                     pass
 
-            location = ""
             loc_data = item.get("location")
-            if loc_data:
-                location = loc_data.get("name", "")
-
-            # Skip description - often contains HTML entities/garbage
-            snippet = ""
+            location = loc_data.get("name", "") if loc_data else ""
 
-            uid = Job.generate_uid(self.source_group, raw_id=str(item["id"]))
+            raw_id = str(item["id"])
 
             jobs.append(
                 Job(
-                    uid=uid,
-                    source_group=self.source_group,
-                    source_name=self.source_name,
+                    uid=generate_uid(source_group, raw_id=raw_id),
+                    source_group=source_group,
+                    source_name=source_name,
                     title=item.get("title", ""),
-                    company=self._config.get("company", self._board_token),
+                    company=company,
                     location=location,
                     url=item.get("absolute_url", ""),
-                    snippet=snippet,
+                    # Skip description - often contains HTML entities/garbage
+                    snippet="",
                     posted_at=posted_at,
-                    raw_id=str(item["id"]),
+                    raw_id=raw_id,
                 )
             )
 
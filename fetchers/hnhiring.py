@@ -1,11 +1,10 @@
 """Fetcher for HN Who is Hiring via hnrss.org RSS feed."""
 
 import logging
-import re
 
 import feedparser
 
-from fetchers.base import BaseFetcher
+from fetchers.base import BaseFetcher, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -34,14 +33,12 @@ class HNHiringFetcher(BaseFetcher):
             description = entry.get("description", "") or entry.get("summary", "")
 
             # Best-effort company parsing from first line
-            company = _parse_company(title_raw, description)
-            title = _parse_title(title_raw, description)
+            company, title = _parse_first_line(title_raw, description)
 
             uid = Job.generate_uid(self.source_group, url=link)
 
             # Strip HTML from description for snippet
-            snippet = re.sub(r"<[^>]+>", " ", description)
-            snippet = re.sub(r"\s+", " ", snippet).strip()
+            snippet = strip_html(description)
 
             jobs.append(
                 Job(
@@ -58,36 +55,22 @@ class HNHiringFetcher(BaseFetcher):
         return jobs
 
 
-def _parse_company(title: str, description: str) -> str:
-    """Best-effort company extraction from HN hiring post.
+def _parse_first_line(title: str, description: str) -> tuple[str, str]:
+    """Best-effort (company, role) extraction from an HN hiring post.
 
-    HN hiring comments typically start with "Company Name | Location | ..."
+    HN hiring comments typically start with "Company Name | Role | Location | ..."
     """
     # Try from title first
     text = title or description
-    first_line = text.split("\n")[0].strip()
+    first_line = text.split("\n", 1)[0].strip()
 
     # Common format: "Company | Role | Location | ..."
     if "|" in first_line:
-        return first_line.split("|")[0].strip()
-
-    # Fallback: first few words
-    words = first_line.split()
-    if words:
-        return " ".join(words[:3])
-
-    return "Unknown"
-
-
-def _parse_title(title: str, description: str) -> str:
-    """Extract job title/role from HN post."""
-    text = title or description
-    first_line = text.split("\n")[0].strip()
-
-    if "|" in first_line:
-        parts = [p.strip() for p in first_line.split("|")]
-        if len(parts) >= 2:
-            return parts[1] if parts[1] else first_line
-        return first_line
-
-    return first_line[:100] if first_line else "HN Hiring Post"
+        parts = first_line.split("|", 2)
+        role = parts[1].strip()
+        return parts[0].strip(), role or first_line
+
+    # Fallback: first few words as company, whole line as role
+    words = first_line.split(maxsplit=3)
+    company = " ".join(words[:3]) if words else "Unknown"
+    return company, first_line[:100] if first_line else "HN Hiring Post"
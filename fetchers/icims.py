@@ -15,9 +15,12 @@ Pagination: ?pr=0, ?pr=1, etc. Page count in ".iCIMS_PagingBatch" links.
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from html import unescape
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, LexborHTMLParser, resilient_get, check_status, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -28,6 +31,27 @@ BROWSER_UA = (
     "AppleWebKit/537.36 (KHTML, like Gecko) "
     "Chrome/120.0.0.0 Safari/537.36"
 )
+# Result pages fetched at once after page 0; kept low to stay polite to the portal
+MAX_WORKERS = 4
+
+# Listing markup patterns (see module docstring)
+_LISTING_SPLIT_RE = re.compile(r'<div[^>]*class="[^"]*col-xs-12 title[^"]*"[^>]*>')
+# Job URL, ID, and title: <a><h3> and <h3><a> themes
+_TITLE_RE = re.compile(
+    r'<a[^>]*href="([^"]*?/jobs/(\d+)/[^"]*?)"[^>]*>.*?<h[23][^>]*>\s*(.*?)\s*</h[23]>',
+    re.DOTALL,
+)
+# Anchor-with-title-attr pattern (some iCIMS themes)
+_TITLE_ATTR_RE = re.compile(r'<a[^>]*href="([^"]*?/jobs/(\d+)/[^"]*?)"[^>]*title="[^"]*?-\s*([^"]+)"')
+_TITLE_PREFIX_RE = re.compile(r"^Job Title\s*")
+_LOCATION_RE = re.compile(r'field-label">Job Locations</span>\s*<span[^>]*>\s*([^<]+)')
+_DATE_RE = re.compile(r'field-label">Posted Date</span>\s*<span[^>]*title="([^"]+)"')
+_DESCRIPTION_RE = re.compile(r'<div[^>]*class="[^"]*description[^"]*"[^>]*>(.*?)</div>', re.DOTALL)
+_CATEGORY_RE = re.compile(r"<dt[^>]*>Category</dt>\s*<dd[^>]*><span[^>]*>\s*([^<]+)")
+_JOB_ID_RE = re.compile(r"/jobs/(\d+)/")
+_TITLE_SUFFIX_RE = re.compile(r"-\s*(.+)$")
+_PAGE_OF_RE = re.compile(r"of (\d+)")
+_PAGE_PARAM_RE = re.compile(r"pr=(\d+)")
 
 
 class ICIMSFetcher(BaseFetcher):
@@ -39,46 +63,112 @@ class ICIMSFetcher(BaseFetcher):
         self._max_pages = source_config.get("max_pages", 10)
 
     def fetch(self) -> list[Job]:
-        jobs = []
-        page = 0
-
-        while page < self._max_pages:
-            url = f"{self._portal_url}{SEARCH_PATH}"
-            params = {"ss": "1", "in_iframe": "1", "pr": str(page)}
+        html = self._fetch_page(0)
+        jobs = self._parse_listings(html)
+        if not jobs:
+            return jobs
+
+        # Page count is known after page 0; the rest are independent
+        last_page = min(self._get_total_pages(html), self._max_pages)
+        if last_page <= 1:
+            return jobs
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, last_page - 1)) as executor:
+            for page_html in executor.map(self._fetch_page, range(1, last_page)):
+                page_jobs = self._parse_listings(page_html)
+                if not page_jobs:
+                    break
+                jobs.extend(page_jobs)
 
-            resp = resilient_get(
-                url,
-                params=params,
-                headers={"Accept": "text/html", "User-Agent": BROWSER_UA},
-                timeout=20,
-            )
-            resp.raise_for_status()
-
-            html = resp.text
-            page_jobs = self._parse_listings(html)
+        return jobs
 
-            if not page_jobs:
-                break
+    def _fetch_page(self, page: int) -> str:
+        resp = resilient_get(
+            f"{self._portal_url}{SEARCH_PATH}",
+            params={"ss": "1", "in_iframe": "1", "pr": str(page)},
+            headers={"Accept": "text/html", "User-Agent": BROWSER_UA},
+            timeout=20,
+        )
+        check_status(resp)
+        return resp.text
 
-            jobs.extend(page_jobs)
+    def _parse_listings(self, html: str) -> list[Job]:
+        """Parse job listings from iCIMS search results HTML."""
+        if LexborHTMLParser is not None:
+            jobs = self._parse_listings_dom(html)
+            if jobs is not None:
+                return jobs
+        return self._parse_listings_regex(html)
+
+    def _parse_listings_dom(self, html: str) -> list[Job] | None:
+        """Parse listings with selectolax CSS queries in a single tokenizer pass.
+
+        Returns None when the page isn't laid out one row per listing, so the
+        caller can fall back to the regex parser.
+        """
+        title_divs = LexborHTMLParser(html).css("div.col-xs-12.title")
+        rows = [div.parent for div in title_divs]
+        if len({row.mem_id for row in rows if row is not None}) != len(title_divs):
+            return None
 
-            total_pages = self._get_total_pages(html)
-            if page + 1 >= total_pages:
-                break
-            page += 1
+        jobs = []
+        for title_div, row in zip(title_divs, rows):
+            anchor = title_div.css_first('a[href*="/jobs/"]')
+            if anchor is None:
+                continue
+            job_url = anchor.attributes.get("href") or ""
+            id_match = _JOB_ID_RE.search(job_url)
+            if not id_match:
+                continue
+
+            heading = anchor.css_first("h2, h3") or title_div.css_first("h2, h3")
+            if heading is not None:
+                title = heading.text(separator=" ")
+            else:
+                # Anchor-with-title-attr themes: title="1234 - Software Engineer"
+                suffix = _TITLE_SUFFIX_RE.search(anchor.attributes.get("title") or "")
+                title = suffix.group(1) if suffix else ""
+
+            location = ""
+            date_str = ""
+            for label in row.css("span.field-label"):
+                name = label.text(strip=True)
+                if name not in ("Job Locations", "Posted Date"):
+                    continue
+                value = _next_element(label)
+                if value is None:
+                    continue
+                if name == "Job Locations":
+                    location = value.text(strip=True)
+                else:
+                    date_str = value.attributes.get("title") or ""
+
+            desc = row.css_first("div.description")
+            snippet = " ".join(desc.text(separator=" ").split()) if desc is not None else ""
+
+            tags = []
+            for dt in row.css("dt"):
+                if dt.text(strip=True) == "Category":
+                    dd = _next_element(dt)
+                    if dd is not None:
+                        tags.append(dd.text(strip=True))
+                    break
+
+            job = self._build_job(id_match.group(1), job_url, title, location, date_str, snippet, tags)
+            if job:
+                jobs.append(job)
 
         return jobs
 
-    def _parse_listings(self, html: str) -> list[Job]:
-        """Parse job listings from iCIMS search results HTML."""
+    def _parse_listings_regex(self, html: str) -> list[Job]:
+        """Regex fallback for when selectolax is unavailable or the layout is unusual."""
         jobs = []
 
         # Split by title divs - works across different iCIMS themes
-        parts = re.split(r'<div[^>]*class="[^"]*col-xs-12 title[^"]*"[^>]*>', html)
+        parts = _LISTING_SPLIT_RE.split(html)
 
-        for i, part in enumerate(parts[1:], 1):
-            # Include the preceding part for location/date context
-            context_before = parts[i - 1] if i > 0 else ""
+        # Pair each listing with the preceding part, which holds its location/date headers
+        for context_before, part in zip(parts, parts[1:]):
             job = self._parse_single_listing(part, context_before)
             if job:
                 jobs.append(job)
@@ -88,77 +178,64 @@ class ICIMSFetcher(BaseFetcher):
     def _parse_single_listing(self, html_fragment: str, context_before: str = "") -> Job | None:
         """Parse a single job listing from an HTML fragment."""
         # Extract job URL, ID, and title - try both <a><h3> and <h3><a> patterns
-        title_match = re.search(
-            r'<a[^>]*href="([^"]*?/jobs/(\d+)/[^"]*?)"[^>]*>.*?<h[23][^>]*>\s*(.*?)\s*</h[23]>',
-            html_fragment,
-            re.DOTALL,
-        )
+        title_match = _TITLE_RE.search(html_fragment)
         if not title_match:
-            # Try the anchor-with-title-attr pattern (some iCIMS themes)
-            title_match = re.search(
-                r'<a[^>]*href="([^"]*?/jobs/(\d+)/[^"]*?)"[^>]*title="[^"]*?-\s*([^"]+)"',
-                html_fragment,
-            )
+            title_match = _TITLE_ATTR_RE.search(html_fragment)
         if not title_match:
             return None
 
-        job_url = title_match.group(1)
-        raw_id = title_match.group(2)
-        title = _strip_html(title_match.group(3)).strip()
-        # Remove "Job Title" prefix that iCIMS adds via sr-only label
-        title = re.sub(r"^Job Title\s*", "", title).strip()
-
-        if not title:
-            return None
+        # Location/date headers precede the title div, so look in the preceding
+        # context first (without concatenating the two strings)
+        loc_match = _LOCATION_RE.search(context_before) or _LOCATION_RE.search(html_fragment)
+        location = unescape(loc_match.group(1).strip()) if loc_match else ""
 
-        # Clean URL: remove in_iframe parameter
-        job_url = re.sub(r"[?&]in_iframe=1", "", job_url)
-        job_url = job_url.rstrip("?")
+        # Extract posted date from title attribute
+        date_match = _DATE_RE.search(context_before) or _DATE_RE.search(html_fragment)
+        date_str = date_match.group(1) if date_match else ""
 
-        # Combine context for location/date extraction
-        full_context = context_before + html_fragment
+        # Extract description snippet
+        desc_match = _DESCRIPTION_RE.search(html_fragment)
+        snippet = strip_html(desc_match.group(1)) if desc_match else ""
 
-        # Extract location from either the current fragment or preceding context
-        location = ""
-        loc_match = re.search(
-            r'field-label">Job Locations</span>\s*<span[^>]*>\s*([^<]+)',
-            full_context,
+        # Extract category from additionalFields
+        cat_match = _CATEGORY_RE.search(html_fragment)
+        tags = [unescape(cat_match.group(1).strip())] if cat_match else []
+
+        return self._build_job(
+            title_match.group(2),
+            title_match.group(1),
+            strip_html(title_match.group(3)),
+            location,
+            date_str,
+            snippet,
+            tags,
         )
-        if loc_match:
-            location = loc_match.group(1).strip()
 
-        # Extract posted date from title attribute
+    def _build_job(
+        self,
+        raw_id: str,
+        job_url: str,
+        title: str,
+        location: str,
+        date_str: str,
+        snippet: str,
+        tags: list[str],
+    ) -> Job | None:
+        """Normalize fields scraped by either parser into a Job."""
+        # Remove "Job Title" prefix that iCIMS adds via sr-only label
+        title = _TITLE_PREFIX_RE.sub("", title.strip()).strip()
+        if not title:
+            return None
+
+        job_url = _clean_job_url(job_url)
+
         posted_at = None
-        date_match = re.search(
-            r'field-label">Posted Date</span>\s*<span[^>]*title="([^"]+)"',
-            full_context,
-        )
-        if date_match:
-            date_str = date_match.group(1).strip()
+        if date_str:
             try:
-                posted_at = datetime.strptime(date_str, "%m/%d/%Y %I:%M %p")
-            except (ValueError, AttributeError):
+                posted_at = datetime.strptime(date_str.strip(), "%m/%d/%Y %I:%M %p")
+            except ValueError:
                 pass
 
-        # Extract description snippet
-        snippet = ""
-        desc_match = re.search(
-            r'<div[^>]*class="[^"]*description[^"]*"[^>]*>(.*?)</div>',
-            html_fragment,
-            re.DOTALL,
-        )
-        if desc_match:
-            snippet = _strip_html(desc_match.group(1))
-
-        # Extract category from additionalFields
-        tags = []
-        cat_match = re.search(
-            r"<dt[^>]*>Category</dt>\s*<dd[^>]*><span[^>]*>\s*([^<]+)",
-            html_fragment,
-        )
-        if cat_match:
-            tags.append(cat_match.group(1).strip())
-
         uid = Job.generate_uid(self.source_group, raw_id=raw_id)
 
         return Job(
@@ -177,23 +254,29 @@ class ICIMSFetcher(BaseFetcher):
 
     def _get_total_pages(self, html: str) -> int:
         """Extract total number of pages from pagination links."""
-        pages = re.findall(r"of (\d+)", html)
+        pages = _PAGE_OF_RE.findall(html)
         if pages:
             return max(int(p) for p in pages)
 
-        page_links = re.findall(r"pr=(\d+)", html)
+        page_links = _PAGE_PARAM_RE.findall(html)
         if page_links:
             return max(int(p) for p in page_links) + 1
 
         return 1
 
 
-def _strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"&nbsp;", " ", text)
-    text = re.sub(r"&amp;", "&", text)
-    text = re.sub(r"&lt;", "<", text)
-    text = re.sub(r"&gt;", ">", text)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+def _clean_job_url(url: str) -> str:
+    """Drop the in_iframe parameter our search requests add to listing links."""
+    parts = urlsplit(url)
+    if "in_iframe" not in parts.query:
+        return url
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k != "in_iframe"]
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def _next_element(node):
+    """Return the next sibling element of a selectolax node, skipping text nodes."""
+    sibling = node.next
+    while sibling is not None and not sibling.is_element_node:
+        sibling = sibling.next
+    return sibling
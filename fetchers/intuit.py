@@ -1,7 +1,9 @@
-"""Fetcher for Intuit Careers using Selenium (Avature/TalentBrew platform).
+"""Fetcher for Intuit Careers (Avature/TalentBrew platform).
 
 Intuit uses Avature ATS with TalentBrew CDN for their recruitment portal.
-The careers page requires JavaScript rendering, so we use Selenium WebDriver.
+The search page renders listings from TalentBrew's results endpoint, which
+returns JSON wrapping an HTML fragment; we call it directly. Selenium
+WebDriver rendering of the full page is kept as a fallback.
 
 URL: https://jobs.intuit.com/search-jobs
 Company ID: 27595
@@ -9,15 +11,20 @@ Company ID: 27595
 
 import logging
 import re
-import time
 from datetime import datetime, timezone
 
-from fetchers.base import BaseFetcher
+from fetchers.base import BaseFetcher, check_status, parse_json, resilient_get, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://jobs.intuit.com"
+RESULTS_URL = f"{BASE_URL}/search-jobs/results"
+
+# Listing anchors in the results fragment: /job/{location}/{title}/27595/{job_id}
+_RESULT_LINK_RE = re.compile(r'<a[^>]*href="(/job/[^"]*?/(\d+))"[^>]*>(.*?)</a>', re.DOTALL)
+_RESULT_TITLE_RE = re.compile(r"<h[23][^>]*>(.*?)</h[23]>", re.DOTALL)
+_RESULT_LOCATION_RE = re.compile(r'<span[^>]*class="[^"]*job-location[^"]*"[^>]*>(.*?)</span>', re.DOTALL)
 
 
 class IntuitFetcher(BaseFetcher):
@@ -29,8 +36,71 @@ class IntuitFetcher(BaseFetcher):
         self._max_pages = source_config.get("max_pages", 10)
         self._results_per_page = source_config.get("results_per_page", 15)  # Intuit shows ~15 per page
         self._headless = source_config.get("headless", True)
+        # Render the page in Chrome if the results endpoint yields nothing
+        self._selenium_fallback = source_config.get("selenium_fallback", True)
 
     def fetch(self) -> list[Job]:
+        try:
+            jobs = self._fetch_via_api()
+        except Exception as e:
+            logger.warning("Intuit: results endpoint failed: %s", e)
+            jobs = []
+
+        if jobs or not self._selenium_fallback:
+            return jobs
+
+        logger.info("Intuit: results endpoint returned no jobs, falling back to Selenium")
+        return self._fetch_via_selenium()
+
+    def _fetch_via_api(self) -> list[Job]:
+        """Page through TalentBrew's results endpoint without a browser."""
+        jobs = []
+        seen_ids = set()
+        for page in range(1, self._max_pages + 1):
+            resp = resilient_get(
+                RESULTS_URL,
+                params={
+                    "Keywords": self._query,
+                    "CurrentPage": page,
+                    "RecordsPerPage": self._results_per_page,
+                    "SearchResultsModuleName": "Search Results",
+                    "SearchType": 5,
+                },
+                headers={"Accept": "application/json", "X-Requested-With": "XMLHttpRequest"},
+            )
+            check_status(resp)
+
+            page_jobs = []
+            for match in _RESULT_LINK_RE.finditer(parse_json(resp).get("results") or ""):
+                path, job_id, inner = match.groups()
+                if job_id in seen_ids:
+                    continue
+                seen_ids.add(job_id)
+
+                title_match = _RESULT_TITLE_RE.search(inner)
+                location_match = _RESULT_LOCATION_RE.search(inner)
+                page_jobs.append(
+                    Job(
+                        uid=Job.generate_uid(self.source_group, raw_id=job_id),
+                        source_group=self.source_group,
+                        source_name=self.source_name,
+                        title=strip_html(title_match.group(1)) if title_match else "Software Engineer",
+                        company="Intuit",
+                        location=strip_html(location_match.group(1)) if location_match else "",
+                        url=BASE_URL + path,
+                        snippet="",
+                        raw_id=job_id,
+                    )
+                )
+
+            jobs.extend(page_jobs)
+            if len(page_jobs) < self._results_per_page:
+                break
+
+        logger.info(f"Intuit: fetched {len(jobs)} jobs from results endpoint")
+        return jobs
+
+    def _fetch_via_selenium(self) -> list[Job]:
         # Import here to make selenium optional for other fetchers
         try:
             from selenium import webdriver
@@ -72,9 +142,9 @@ class IntuitFetcher(BaseFetcher):
 
                 logger.info(f"Intuit: loading page {page}...")
                 driver.get(url)
-                time.sleep(4)  # Wait for JavaScript to load job listings
 
-                # Wait for job listings to load
+                # Wait for JavaScript to render the job listings; returns as soon
+                # as they appear instead of sleeping a fixed interval
                 wait = WebDriverWait(driver, 15)
                 try:
                     # Intuit uses <section class="jobs-list-section"> or similar for job cards
@@ -184,7 +254,6 @@ class IntuitFetcher(BaseFetcher):
                         break
 
                 page += 1
-                time.sleep(2)  # Rate limiting between pages
 
         except Exception as e:
             logger.error(f"Intuit: selenium fetch failed: {e}")
@@ -4,7 +4,7 @@ Jibe provides a JSON API at {base_url}/api/jobs with pagination support.
 
 API Structure:
 - Endpoint: {base_url}/api/jobs?page=1
-- Pagination: ~10 jobs per page, empty jobs array = end
+- Pagination: ~10 jobs per page, empty jobs array = end; totalCount when present
 - Filtering: &categories=Engineering
 - Response: {"jobs": [{"data": {...}}, ...]}
 
@@ -16,14 +16,18 @@ Config fields:
 """
 
 import logging
-import re
+import math
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, check_status, conditional_get, parse_json, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
 
+# Number of result pages requested concurrently after page 1
+PAGE_WINDOW = 8
+
 
 class JibeFetcher(BaseFetcher):
     """Fetcher for Jibe/iCIMS-powered career sites with JSON API."""
@@ -50,38 +54,64 @@ class JibeFetcher(BaseFetcher):
         return jobs
 
     def _fetch_category(self, category: str | None) -> list[Job]:
-        jobs = []
-        page = 1
-
-        while page <= self._max_pages:
-            params: dict = {"page": page}
-            if category:
-                params["categories"] = category
-
-            resp = resilient_get(
-                self._api_url,
-                params=params,
-                headers={"Accept": "application/json"},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            job_list = data.get("jobs", [])
-            if not job_list:
-                break
-
-            for item in job_list:
-                job = self._parse_job(item)
-                if job:
-                    jobs.append(job)
-
-            if len(job_list) < self._page_size:
-                break
-
-            page += 1
+        """Fetch all jobs for a category.
+
+        Page 1 is fetched on its own so empty categories cost one request.
+        If it reports a total, exactly the remaining pages are fetched
+        concurrently; otherwise pages are requested PAGE_WINDOW at a time,
+        and the window containing an empty or short page is the last one.
+        """
+        jobs: list[Job] = []
+        first = self._fetch_page(category, 1)
+        if not self._add_page(jobs, first.get("jobs", [])):
+            return jobs
+
+        def fetch_jobs(page: int) -> list[dict]:
+            return self._fetch_page(category, page).get("jobs", [])
+
+        total = _total_count(first)
+        if total is not None:
+            last_page = min(math.ceil(total / self._page_size), self._max_pages)
+            pages = range(2, last_page + 1)
+            if pages:
+                with ThreadPoolExecutor(max_workers=min(PAGE_WINDOW, len(pages))) as executor:
+                    for job_list in executor.map(fetch_jobs, pages):
+                        if not self._add_page(jobs, job_list):
+                            break
+            return jobs
+
+        page = 2
+        with ThreadPoolExecutor(max_workers=PAGE_WINDOW) as executor:
+            while page <= self._max_pages:
+                window = range(page, min(page + PAGE_WINDOW, self._max_pages + 1))
+                for job_list in executor.map(fetch_jobs, window):
+                    if not self._add_page(jobs, job_list):
+                        return jobs
+                page = window.stop
 
         return jobs
 
+    def _add_page(self, jobs: list[Job], job_list: list[dict]) -> bool:
+        """Parse a page into jobs; return False if it was the last page."""
+        for item in job_list:
+            job = self._parse_job(item)
+            if job:
+                jobs.append(job)
+        return len(job_list) >= self._page_size
+
+    def _fetch_page(self, category: str | None, page: int) -> dict:
+        params: dict = {"page": page}
+        if category:
+            params["categories"] = category
+
+        resp = conditional_get(
+            self._api_url,
+            params=params,
+            headers={"Accept": "application/json"},
+        )
+        check_status(resp)
+        return parse_json(resp)
+
     def _parse_job(self, item: dict) -> Job | None:
         job_data = item.get("data", {})
         if not job_data:
@@ -98,21 +128,21 @@ class JibeFetcher(BaseFetcher):
         city = job_data.get("city", "")
         state = job_data.get("state", "")
         country = job_data.get("country", "")
-        location = ", ".join(p for p in (city, state, country) if p)
+        location = ", ".join([p for p in (city, state, country) if p])
 
         job_url = job_data.get("apply_url", "")
         if not job_url:
             job_url = f"{self._careers_url}/{raw_id}"
 
         description = job_data.get("description", "") or job_data.get("qualifications", "")
-        snippet = _strip_html(description)
+        snippet = strip_html(description)
 
         posted_at = None
         posted_date = job_data.get("posted_date")
         if posted_date:
             try:
-                posted_at = datetime.fromisoformat(posted_date.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
+                posted_at = datetime.fromisoformat(posted_date)
+            except (ValueError, TypeError):
                 pass
 
         uid = Job.generate_uid(self.source_group, raw_id=raw_id)
@@ -131,7 +161,11 @@ class JibeFetcher(BaseFetcher):
         )
 
 
-def _strip_html(html: str) -> str:
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+def _total_count(data: dict) -> int | None:
+    """Return the result total if the response carries one."""
+    for container in (data, data.get("meta") or {}):
+        for key in ("totalCount", "total"):
+            value = container.get(key)
+            if isinstance(value, int):
+                return value
+    return None
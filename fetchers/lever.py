@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime, timezone
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, check_status, conditional_get, parse_json
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -21,43 +21,44 @@ class LeverFetcher(BaseFetcher):
 
     def fetch(self) -> list[Job]:
         url = f"https://api.lever.co/v0/postings/{self._slug}?mode=json"
-        resp = resilient_get(url)
-        resp.raise_for_status()
-        postings = resp.json()
+        resp = conditional_get(url)
+        check_status(resp)
+        postings = parse_json(resp)
 
         if not isinstance(postings, list):
             logger.warning("Lever response is not a list for slug=%s", self._slug)
             return []
 
+        source_group = self.source_group
+        source_name = self.source_name
+        company = self._config.get("company", self._slug)
+
         jobs = []
         for item in postings:
-            posted_at = None
+            # Read each field once
+            posting_id = item.get("id", "")
             created_ms = item.get("createdAt")
+            categories = item.get("categories")
+
+            posted_at = None
             if created_ms:
                 try:
                     posted_at = datetime.fromtimestamp(created_ms / 1000, tz=timezone.utc)
                 except (ValueError, TypeError, OSError):
                     pass
 
-            location = ""
-            categories = item.get("categories", {})
-            if categories:
-                location = categories.get("location", "")
-
-            uid = Job.generate_uid(self.source_group, raw_id=item.get("id", ""))
-
             jobs.append(
                 Job(
-                    uid=uid,
-                    source_group=self.source_group,
-                    source_name=self.source_name,
+                    uid=Job.generate_uid(source_group, raw_id=posting_id),
+                    source_group=source_group,
+                    source_name=source_name,
                     title=item.get("text", ""),
-                    company=self._config.get("company", self._slug),
-                    location=location,
+                    company=company,
+                    location=categories.get("location", "") if categories else "",
                     url=item.get("hostedUrl", ""),
                     snippet=item.get("descriptionPlain", ""),
                     posted_at=posted_at,
-                    raw_id=item.get("id", ""),
+                    raw_id=posting_id,
                 )
             )
 
@@ -10,9 +10,14 @@ that blocks all automated access (Selenium, Playwright, residential proxies all
 import logging
 import random
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Iterable
 
-from bs4 import BeautifulSoup
+import requests
+from lxml import etree
 
 from fetchers.base import BaseFetcher
 from models import Job
@@ -21,6 +26,9 @@ logger = logging.getLogger(__name__)
 
 _BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
 
+# Companies fetched concurrently; kept low so LinkedIn sees a trickle
+MAX_WORKERS = 4
+
 _UA_POOL = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36",
@@ -32,21 +40,31 @@ _COMMON_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     "Accept-Language": "en-US,en;q=0.5",
     "Accept-Encoding": "gzip, deflate, br",
-    "Connection": "keep-alive",
     "Sec-Fetch-Dest": "document",
     "Sec-Fetch-Mode": "navigate",
     "Sec-Fetch-Site": "none",
     "Sec-Fetch-User": "?1",
 }
 
-# Job ID pattern from LinkedIn URLs: /jobs/view/title-slug-1234567890
-_JOB_ID_RE = re.compile(r"/jobs/view/[^?]*?(\d{8,})")
+# Job ID pattern from LinkedIn URLs: /jobs/view/title-slug-1234567890.
+# Matched against the path only, anchored on the trailing id, so there is
+# no lazy quantifier to backtrack through
+_JOB_ID_RE = re.compile(r"/jobs/view/(?:[^/]*\D)?(\d{8,})/?$")
+
+# Response body chunk fed to the incremental parser
+_CHUNK_SIZE = 16 * 1024
+
+# Job card fields, compiled once rather than per card
+_X_LINK = etree.XPath(".//a[contains(@class, 'base-card__full-link')]/@href")
+_X_TITLE = etree.XPath(".//h3[contains(@class, 'base-search-card__title')]//text()")
+_X_COMPANY = etree.XPath(".//h4[contains(@class, 'base-search-card__subtitle')]//text()")
+_X_LOCATION = etree.XPath(".//span[contains(@class, 'job-search-card__location')]//text()")
+_X_LISTDATE = etree.XPath(".//time[contains(@class, 'job-search-card__listdate')]/@datetime")
 
 
-def _random_headers() -> dict:
-    headers = dict(_COMMON_HEADERS)
-    headers["User-Agent"] = random.choice(_UA_POOL)
-    return headers
+def _text(parts: list[str]) -> str:
+    """Join XPath text nodes and collapse whitespace."""
+    return " ".join("".join(parts).split())
 
 
 class LinkedInFetcher(BaseFetcher):
@@ -60,52 +78,80 @@ class LinkedInFetcher(BaseFetcher):
         self._delay_range = source_config.get("request_delay", [3, 5])
         self._backoff = 0  # Current backoff seconds (0 = no backoff)
         self._max_backoff = 1800  # 30 minutes
+        self._paused_until = 0.0  # time.monotonic() deadline set by a 429
+        self._lock = threading.Lock()
+        self._session = None
 
     def fetch(self) -> list[Job]:
-        import requests
+        if not self._companies:
+            return []
+
+        # Kept across cycles so LinkedIn connections stay warm between polls
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update(_COMMON_HEADERS)
+        session = self._session
 
         all_jobs = []
-        session = requests.Session()
 
-        for company in self._companies:
-            name = company["name"]
-            lid = company["linkedin_id"]
+        # Companies are fetched a few at a time; each worker still sleeps a
+        # random delay per request, and a 429 pauses all of them
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(self._companies))) as executor:
+            for jobs in executor.map(
+                lambda company: self._fetch_company_throttled(session, company),
+                self._companies,
+            ):
+                all_jobs.extend(jobs)
 
-            if self._backoff > 0:
-                logger.warning(
-                    "LinkedIn: backing off %ds before %s", self._backoff, name
-                )
-                time.sleep(self._backoff)
+        return all_jobs
 
-            # Rate limit between companies
-            delay = random.uniform(*self._delay_range)
-            time.sleep(delay)
+    def _fetch_company_throttled(self, session, company: dict) -> list[Job]:
+        """Fetch one company, honouring the request delay and shared backoff."""
+        name = company["name"]
+        lid = company["linkedin_id"]
+
+        # Rate limit between requests
+        time.sleep(random.uniform(*self._delay_range))
+
+        with self._lock:
+            wait = self._paused_until - time.monotonic()
+        if wait > 0:
+            logger.warning("LinkedIn: backing off %ds before %s", wait, name)
+            time.sleep(wait)
+
+        sent_at = time.monotonic()
+        try:
+            jobs = self._fetch_company(session, name, lid)
+        except _RateLimitError:
+            # 429 — exponential backoff, shared by every worker. Requests sent
+            # before the current pause ended belong to the burst that set it,
+            # so they keep that pause instead of escalating it again.
+            with self._lock:
+                if sent_at >= self._paused_until:
+                    self._backoff = min(max(60, self._backoff * 2), self._max_backoff)
+                    self._paused_until = time.monotonic() + self._backoff
+                backoff = self._backoff
+            logger.warning(
+                "LinkedIn: 429 rate limited on %s, backoff now %ds",
+                name,
+                backoff,
+            )
+            return []
+        except Exception as e:
+            logger.warning("LinkedIn: error fetching %s: %s", name, e)
+            return []
 
-            try:
-                jobs = self._fetch_company(session, name, lid)
-                all_jobs.extend(jobs)
-                # Successful request — reset backoff
+        # Successful request — reset backoff, unless it was sent before a
+        # pause that is still in effect
+        with self._lock:
+            if sent_at >= self._paused_until:
                 self._backoff = 0
-            except _RateLimitError:
-                # 429 — exponential backoff
-                self._backoff = max(60, self._backoff * 2) if self._backoff else 60
-                self._backoff = min(self._backoff, self._max_backoff)
-                logger.warning(
-                    "LinkedIn: 429 rate limited on %s, backoff now %ds",
-                    name,
-                    self._backoff,
-                )
-            except Exception as e:
-                logger.warning("LinkedIn: error fetching %s: %s", name, e)
-
-        return all_jobs
+        return jobs
 
     def _fetch_company(
         self, session, company_name: str, linkedin_id: str
     ) -> list[Job]:
         """Fetch the most recent jobs for a single company."""
-        import requests
-
         params = {
             "f_C": linkedin_id,
             "location": "United States",
@@ -113,81 +159,96 @@ class LinkedInFetcher(BaseFetcher):
             "start": "0",
         }
 
-        resp = session.get(
-            _BASE_URL, params=params, headers=_random_headers(), timeout=15
-        )
-
-        if resp.status_code == 429:
-            raise _RateLimitError()
-
-        if resp.status_code != 200:
-            logger.warning(
-                "LinkedIn: %s returned %d", company_name, resp.status_code
+        with session.get(
+            _BASE_URL,
+            params=params,
+            # Only the UA rotates; the rest are session headers
+            headers={"User-Agent": random.choice(_UA_POOL)},
+            timeout=15,
+            stream=True,
+        ) as resp:
+            if resp.status_code == 429:
+                raise _RateLimitError()
+
+            if resp.status_code != 200:
+                logger.warning(
+                    "LinkedIn: %s returned %d", company_name, resp.status_code
+                )
+                return []
+
+            # Feed the decompressed body straight into the parser instead of
+            # materializing resp.text first
+            return self._parse_chunks(
+                resp.iter_content(chunk_size=_CHUNK_SIZE),
+                company_name,
+                encoding=resp.encoding or "utf-8",
             )
-            return []
-
-        return self._parse_jobs(resp.text, company_name)
 
     def _parse_jobs(self, html: str, company_name: str) -> list[Job]:
         """Parse job cards from LinkedIn HTML response."""
-        soup = BeautifulSoup(html, "lxml")
-        jobs = []
+        return self._parse_chunks([html], company_name)
+
+    def _parse_chunks(
+        self, chunks: Iterable[str | bytes], company_name: str, encoding: str = "utf-8"
+    ) -> list[Job]:
+        """Incrementally parse job cards, handling each <li> as it closes."""
+        parser = etree.HTMLPullParser(events=("end",), tag="li", encoding=encoding)
+        jobs: list[Job] = []
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            self._collect_cards(parser, company_name, jobs)
+        parser.close()
+        self._collect_cards(parser, company_name, jobs)
 
-        for card in soup.select("li"):
+        return jobs
+
+    def _collect_cards(self, parser, company_name: str, jobs: list[Job]) -> None:
+        for _, card in parser.read_events():
             try:
                 job = self._parse_card(card, company_name)
                 if job:
                     jobs.append(job)
             except Exception as e:
                 logger.debug("LinkedIn: error parsing card: %s", e)
-
-        return jobs
+            card.clear()
 
     def _parse_card(self, card, company_name: str) -> Job | None:
         """Parse a single job card element into a Job."""
         # Extract job URL and ID
-        link = card.select_one("a.base-card__full-link")
-        if not link:
-            return None
-
-        url = (link.get("href") or "").strip()
+        hrefs = _X_LINK(card)
+        url = hrefs[0].strip() if hrefs else ""
         if not url:
             return None
 
+        # Clean URL (remove tracking params)
+        url = url.split("?", 1)[0]
+
         # Extract job ID from URL
         match = _JOB_ID_RE.search(url)
         if not match:
             return None
         job_id = match.group(1)
 
-        # Clean URL (remove tracking params)
-        url = url.split("?")[0]
-
         # Extract title
-        title_el = card.select_one("h3.base-search-card__title")
-        title = title_el.get_text(strip=True) if title_el else ""
+        title = _text(_X_TITLE(card))
         if not title:
             return None
 
         # Extract company name from card (might differ from our company_name)
-        company_el = card.select_one("h4.base-search-card__subtitle")
-        card_company = company_el.get_text(strip=True) if company_el else company_name
+        card_company = _text(_X_COMPANY(card)) or company_name
 
         # Extract location
-        location_el = card.select_one("span.job-search-card__location")
-        location = location_el.get_text(strip=True) if location_el else ""
+        location = _text(_X_LOCATION(card))
 
         # Extract posted date
         posted_at = None
-        time_el = card.select_one("time.job-search-card__listdate")
-        if time_el:
-            date_str = time_el.get("datetime", "")
-            if date_str:
-                try:
-                    from datetime import datetime
-                    posted_at = datetime.fromisoformat(date_str)
-                except ValueError:
-                    pass
+        date_attrs = _X_LISTDATE(card)
+        if date_attrs and date_attrs[0]:
+            try:
+                posted_at = datetime.fromisoformat(date_attrs[0])
+            except ValueError:
+                pass
 
         uid = Job.generate_uid(self.source_group, raw_id=job_id)
 
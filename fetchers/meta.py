@@ -18,10 +18,11 @@ import json
 import logging
 import re
 import time
+from html import unescape
 
 import requests
 
-from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT
+from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT, check_status, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,12 @@ GRAPHQL_URL = "https://www.metacareers.com/api/graphql/"
 # Use Tor SOCKS proxy to bypass IP bans (more reliable than free HTTP proxies)
 TOR_PROXY = "socks5://127.0.0.1:9050"
 
+# LSD (CSRF) token, from the server JS config or the hidden form input
+_LSD_CONFIG_RE = re.compile(r'"LSD"\s*,\s*\[\]\s*,\s*\{"token"\s*:\s*"([^"]+)"')
+_LSD_INPUT_RE = re.compile(r'name="lsd"\s+value="([^"]+)"')
+_WS_RE = re.compile(r"\s*")
+_JSON_DECODER = json.JSONDecoder()
+
 
 def _rotate_tor_ip():
     """Request a new Tor circuit (new exit IP) via control port."""
@@ -117,7 +124,7 @@ class MetaFetcher(BaseFetcher):
             # Use longer timeout for proxies (30s instead of 15s)
             timeout = 30 if session.proxies else DEFAULT_TIMEOUT
             resp = session.get(CAREERS_URL, timeout=timeout)
-            resp.raise_for_status()
+            check_status(resp)
         except Exception as e:
             logger.debug("Meta: failed to load careers page: %s", e)
             return {}
@@ -125,32 +132,24 @@ class MetaFetcher(BaseFetcher):
         result = {}
 
         # Extract LSD token
-        match = re.search(r'"LSD"\s*,\s*\[\]\s*,\s*\{"token"\s*:\s*"([^"]+)"', resp.text)
+        match = _LSD_CONFIG_RE.search(resp.text)
         if match:
             result["lsd_token"] = match.group(1)
         else:
-            match = re.search(r'name="lsd"\s+value="([^"]+)"', resp.text)
+            match = _LSD_INPUT_RE.search(resp.text)
             if match:
                 result["lsd_token"] = match.group(1)
 
         # Try to extract embedded job data from __RELAY_DATA__ or similar
-        for pattern in [
-            r'__RELAY_DATA__\s*=\s*(\{.*?\});',
-            r'"job_search":\s*(\{.*?"results":\s*\[.*?\].*?\})',
-            r'data-content="(\{.*?job.*?\})"',
-        ]:
-            match = re.search(pattern, resp.text, re.DOTALL)
-            if match:
-                try:
-                    data = json.loads(match.group(1))
-                    jobs = self._extract_jobs_from_data(data)
-                    if jobs:
-                        result["jobs"] = jobs
-                        break
-                except json.JSONDecodeError as e:
-                    logger.debug("Meta: failed to parse embedded JSON: %s", e)
-                except KeyError as e:
-                    logger.debug("Meta: missing key in embedded data: %s", e)
+        for data in _iter_embedded_json(resp.text):
+            try:
+                jobs = self._extract_jobs_from_data(data)
+            except KeyError as e:
+                logger.debug("Meta: missing key in embedded data: %s", e)
+                continue
+            if jobs:
+                result["jobs"] = jobs
+                break
 
         return result
 
@@ -249,7 +248,7 @@ class MetaFetcher(BaseFetcher):
                 item.get("short_description", "") or
                 (item.get("teams", [""])[0] if item.get("teams") else "")
             )
-            snippet = _strip_html(description)
+            snippet = strip_html(description)
 
             raw_id = f"meta:{job_id}"
             uid = Job.generate_uid(self.source_group, raw_id=raw_id)
@@ -271,6 +270,44 @@ class MetaFetcher(BaseFetcher):
         return jobs
 
 
+def _decode_json_at(text: str, idx: int):
+    """Decode the JSON value starting at text[idx], ignoring what follows it.
+
+    raw_decode consumes exactly one balanced value in a single linear pass,
+    so there's no regex guessing where the object ends.
+    """
+    try:
+        value, _ = _JSON_DECODER.raw_decode(text, _WS_RE.match(text, idx).end())
+    except json.JSONDecodeError as e:
+        logger.debug("Meta: failed to parse embedded JSON: %s", e)
+        return None
+    return value
+
+
+def _iter_embedded_json(text: str):
+    """Yield JSON blobs embedded in the careers page, most reliable first.
+
+    Each anchor is located with str.find and only decoded when the previous
+    candidate didn't contain jobs.
+    """
+    idx = text.find("__RELAY_DATA__")
+    if idx != -1:
+        idx = _WS_RE.match(text, idx + len("__RELAY_DATA__")).end()
+        if text.startswith("=", idx):
+            yield _decode_json_at(text, idx + 1)
+
+    idx = text.find('"job_search":')
+    if idx != -1:
+        yield _decode_json_at(text, idx + len('"job_search":'))
+
+    idx = text.find('data-content="')
+    if idx != -1:
+        start = idx + len('data-content="')
+        end = text.find('"', start)
+        if end != -1:
+            yield _decode_json_at(unescape(text[start:end]), 0)
+
+
 def _format_locations(locations: list) -> str:
     """Format Meta location data into a readable string."""
     if not locations:
@@ -287,12 +324,3 @@ def _format_locations(locations: list) -> str:
         elif isinstance(loc, str):
             parts.append(loc)
     return " | ".join(parts[:3])
-
-
-def _strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace."""
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
@@ -1,19 +1,44 @@
-"""Fetcher for Microsoft Careers using Selenium (Eightfold AI platform).
+"""Fetcher for Microsoft Careers (Eightfold AI platform).
 
 Microsoft migrated from gcsservices API to Eightfold AI platform at
-apply.careers.microsoft.com in early 2026.
+apply.careers.microsoft.com in early 2026. The careers page loads its results
+from Eightfold's JSON jobs API (the same one Netflix's portal uses), which we
+call directly. Selenium rendering of the careers page is kept as a fallback.
 """
 
 import logging
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from fetchers.base import BaseFetcher
+from fetchers.base import BaseFetcher, check_status, parse_json, resilient_get, strip_html
 from models import Job
 
 logger = logging.getLogger(__name__)
 
 BASE_URL = "https://apply.careers.microsoft.com/careers"
+API_URL = "https://apply.careers.microsoft.com/api/apply/v2/jobs"
+
+# Concurrent API page requests after the first page
+MAX_WORKERS = 8
+
+_JOB_ID_RE = re.compile(r"/careers/job/(\d+)")
+
+# Returns href, title, location and text lines for every job card at once,
+# instead of several find_element/get_attribute RPCs per card. title and
+# location are null when the card lacks those elements.
+_EXTRACT_CARDS_JS = """
+return Array.from(document.querySelectorAll("a[href^='/careers/job/']"), a => {
+    const title = a.querySelector('.title-1aNJK');
+    const location = a.querySelector('.fieldValue-3kEar');
+    return {
+        href: a.href,
+        title: title ? title.innerText.trim() : null,
+        location: location ? location.innerText.trim() : null,
+        lines: a.innerText.split('\\n').map(l => l.trim()).filter(Boolean),
+    };
+});
+"""
 
 
 class MicrosoftFetcher(BaseFetcher):
@@ -25,8 +50,92 @@ class MicrosoftFetcher(BaseFetcher):
         self._max_pages = source_config.get("max_pages", 10)
         self._results_per_page = source_config.get("results_per_page", 100)
         self._headless = source_config.get("headless", True)
+        # Render the careers page in Chrome if the jobs API yields nothing
+        self._selenium_fallback = source_config.get("selenium_fallback", True)
 
     def fetch(self) -> list[Job]:
+        try:
+            jobs = self._fetch_via_api()
+        except Exception as e:
+            logger.warning("Microsoft: jobs API failed: %s", e)
+            jobs = []
+
+        if jobs or not self._selenium_fallback:
+            return jobs
+
+        logger.info("Microsoft: jobs API returned no jobs, falling back to Selenium")
+        return self._fetch_via_selenium()
+
+    def _fetch_via_api(self) -> list[Job]:
+        """Page through Eightfold's jobs API without a browser.
+
+        The first page carries the total count; the remaining pages (up to
+        max_pages) are then fetched concurrently.
+        """
+        data = self._fetch_page(0)
+        positions = data.get("positions", [])
+        jobs = self._parse_positions(positions)
+        if not positions:
+            return jobs
+
+        total = min(data.get("count", 0), self._max_pages * self._results_per_page)
+        offsets = range(self._results_per_page, total, self._results_per_page)
+        if offsets:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(offsets))) as executor:
+                for page in executor.map(self._fetch_page, offsets):
+                    jobs.extend(self._parse_positions(page.get("positions", [])))
+
+        logger.info("Microsoft: fetched %d jobs via API", len(jobs))
+        return jobs
+
+    def _fetch_page(self, start: int) -> dict:
+        resp = resilient_get(
+            API_URL,
+            params={
+                "domain": "microsoft.com",
+                "query": self._query,
+                "start": start,
+                "num": self._results_per_page,
+                "sort_by": "relevance",
+            },
+            headers={"Accept": "application/json"},
+        )
+        check_status(resp)
+        return parse_json(resp)
+
+    def _parse_positions(self, positions: list[dict]) -> list[Job]:
+        jobs = []
+        for item in positions:
+            job_id = str(item.get("id", ""))
+            if not job_id:
+                continue
+            title = item.get("name", "")
+
+            location = item.get("location", "")
+            locations = item.get("locations", [])
+            if locations and isinstance(locations, list):
+                location = locations[0] if len(locations) == 1 else " | ".join(locations[:3])
+
+            url = item.get("canonicalPositionUrl") or f"{BASE_URL}/job/{job_id}"
+            snippet = strip_html(item.get("job_description", "")) or f"{title} at Microsoft - {location}"
+
+            raw_id = f"microsoft:{job_id}"
+            jobs.append(
+                Job(
+                    uid=Job.generate_uid(self.source_group, raw_id=raw_id),
+                    source_group=self.source_group,
+                    source_name=self.source_name,
+                    title=title,
+                    company="Microsoft",
+                    location=location,
+                    url=url,
+                    snippet=snippet,
+                    raw_id=raw_id,
+                )
+            )
+        return jobs
+
+    def _fetch_via_selenium(self) -> list[Job]:
         # Import here to make selenium optional for other fetchers
         try:
             from selenium import webdriver
@@ -80,49 +189,33 @@ class MicrosoftFetcher(BaseFetcher):
                     logger.warning(f"Microsoft: no job cards found on page {page + 1}: {e}")
                     break
 
-                # Find all job card links
-                job_elements = driver.find_elements(By.CSS_SELECTOR, "a[href^='/careers/job/']")
-                logger.info(f"Microsoft: found {len(job_elements)} job cards on page {page + 1}")
+                # Pull every card's fields in a single WebDriver round trip
+                cards = driver.execute_script(_EXTRACT_CARDS_JS) or []
+                logger.info(f"Microsoft: found {len(cards)} job cards on page {page + 1}")
 
-                if not job_elements:
+                if not cards:
                     break
 
                 page_jobs = []
-                for job_elem in job_elements:
+                for card in cards:
                     try:
-                        # Extract job data from the card
-                        href = job_elem.get_attribute("href")
-                        job_id_match = re.search(r"/careers/job/(\d+)", href)
+                        href = card.get("href") or ""
+                        job_id_match = _JOB_ID_RE.search(href)
                         if not job_id_match:
                             continue
 
                         job_id = job_id_match.group(1)
+                        lines = card.get("lines") or []
+
+                        # Title element, else the card's first text line
+                        title = card.get("title")
+                        if title is None:
+                            title = lines[0] if lines else "Microsoft Position"
 
-                        # Find title within the card
-                        try:
-                            title_elem = job_elem.find_element(By.CSS_SELECTOR, ".title-1aNJK")
-                            title = title_elem.text.strip()
-                        except:
-                            # Fallback: parse from full text
-                            try:
-                                full_text = job_elem.text.strip()
-                                lines = [l.strip() for l in full_text.split('\n') if l.strip()]
-                                title = lines[0] if lines else "Microsoft Position"
-                            except:
-                                title = "Microsoft Position"
-
-                        # Find location
-                        try:
-                            location_elem = job_elem.find_element(By.CSS_SELECTOR, ".fieldValue-3kEar")
-                            location = location_elem.text.strip()
-                        except:
-                            # Fallback: parse from full text (location is usually second line)
-                            try:
-                                full_text = job_elem.text.strip()
-                                lines = [l.strip() for l in full_text.split('\n') if l.strip()]
-                                location = lines[1] if len(lines) > 1 else "Multiple Locations"
-                            except:
-                                location = "Multiple Locations"
+                        # Location element, else the second line
+                        location = card.get("location")
+                        if location is None:
+                            location = lines[1] if len(lines) > 1 else "Multiple Locations"
 
                         # Build full URL
                         if href.startswith("/"):
@@ -157,7 +250,7 @@ class MicrosoftFetcher(BaseFetcher):
                 logger.info(f"Microsoft: extracted {len(page_jobs)} jobs from page {page + 1}")
 
                 # Check if we got fewer results than expected (last page)
-                if len(job_elements) < self._results_per_page:
+                if len(cards) < self._results_per_page:
                     logger.info("Microsoft: reached last page")
                     break
 
@@ -1,9 +1,9 @@
 """Fetcher for Netflix Jobs via their Eightfold-powered careers portal."""
 
 import logging
-import re
+from concurrent.futures import ThreadPoolExecutor
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, parse_json, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -11,6 +11,10 @@ logger = logging.getLogger(__name__)
 # Netflix moved to Eightfold platform at explore.jobs.netflix.net
 BASE_URL = "https://explore.jobs.netflix.net/api/apply/v2/jobs"
 
+# Jobs per request, and concurrent page requests after the first page
+PAGE_SIZE = 100
+MAX_WORKERS = 8
+
 
 class NetflixFetcher(BaseFetcher):
     source_group = "maang"
@@ -20,69 +24,70 @@ class NetflixFetcher(BaseFetcher):
         self._base_url = source_config.get("base_url", BASE_URL)
 
     def fetch(self) -> list[Job]:
-        jobs = []
-        start = 0
-        num = 100  # Jobs per request
-
-        while True:
-            resp = resilient_get(
-                self._base_url,
-                params={"domain": "netflix.com", "start": start, "num": num},
-            )
-            resp.raise_for_status()
-            data = resp.json()
-
-            positions = data.get("positions", [])
-            if not positions:
-                break
-
-            for item in positions:
-                job_id = str(item.get("id", ""))
-                title = item.get("name", "")
-                location = item.get("location", "")
-
-                # Handle multiple locations
-                locations = item.get("locations", [])
-                if locations and isinstance(locations, list):
-                    location = locations[0] if len(locations) == 1 else " | ".join(locations[:3])
-
-                canonical_url = item.get("canonicalPositionUrl", "")
-                url = canonical_url or f"https://explore.jobs.netflix.net/careers/job/{job_id}"
-
-                department = item.get("department", "")
-                business_unit = item.get("business_unit", "")
-                snippet = f"{department} - {business_unit}" if department and business_unit else department or business_unit
-
-                raw_id = f"netflix:{job_id}"
-                uid = Job.generate_uid(self.source_group, raw_id=raw_id)
-
-                tags = [department] if department else []
-
-                jobs.append(
-                    Job(
-                        uid=uid,
-                        source_group=self.source_group,
-                        source_name=self.source_name,
-                        title=title,
-                        company=self._config.get("company", "Netflix"),
-                        location=location,
-                        url=url,
-                        snippet=snippet,
-                        raw_id=raw_id,
-                        tags=tags,
-                    )
-                )
-
-            total = data.get("count", 0)
-            start += num
-            if start >= total:
-                break
+        # The first page carries the total count; the remaining pages are
+        # then independent and fetched concurrently.
+        data = self._fetch_page(0)
+        positions = data.get("positions", [])
+        jobs = self._parse_positions(positions)
+        if not positions:
+            return jobs
+
+        offsets = range(PAGE_SIZE, data.get("count", 0), PAGE_SIZE)
+        if not offsets:
+            return jobs
+
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(offsets))) as executor:
+            for page in executor.map(self._fetch_page, offsets):
+                jobs.extend(self._parse_positions(page.get("positions", [])))
 
         return jobs
 
+    def _fetch_page(self, start: int) -> dict:
+        """Fetch one page of positions starting at offset start."""
+        resp = resilient_get(
+            self._base_url,
+            params={"domain": "netflix.com", "start": start, "num": PAGE_SIZE},
+        )
+        check_status(resp)
+        return parse_json(resp)
 
-def _strip_html(html: str) -> str:
-    """Remove HTML tags and collapse whitespace."""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
+    def _parse_positions(self, positions: list[dict]) -> list[Job]:
+        jobs = []
+        for item in positions:
+            job_id = str(item.get("id", ""))
+            title = item.get("name", "")
+            location = item.get("location", "")
+
+            # Handle multiple locations
+            locations = item.get("locations", [])
+            if locations and isinstance(locations, list):
+                location = locations[0] if len(locations) == 1 else " | ".join(locations[:3])
+
+            canonical_url = item.get("canonicalPositionUrl", "")
+            url = canonical_url or f"https://explore.jobs.netflix.net/careers/job/{job_id}"
+
+            department = item.get("department", "")
+            business_unit = item.get("business_unit", "")
+            snippet = f"{department} - {business_unit}" if department and business_unit else department or business_unit
+
+            raw_id = f"netflix:{job_id}"
+            uid = Job.generate_uid(self.source_group, raw_id=raw_id)
+
+            tags = [department] if department else []
+
+            jobs.append(
+                Job(
+                    uid=uid,
+                    source_group=self.source_group,
+                    source_name=self.source_name,
+                    title=title,
+                    company=self._config.get("company", "Netflix"),
+                    location=location,
+                    url=url,
+                    snippet=snippet,
+                    raw_id=raw_id,
+                    tags=tags,
+                )
+            )
+
+        return jobs
@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class NewGradJSONFetcher(BaseFetcher):
             f"/{self._branch}/{self._json_path}"
         )
         resp = resilient_get(url)
-        resp.raise_for_status()
+        check_status(resp)
         listings = resp.json()
 
         jobs = []
@@ -45,8 +45,8 @@ class NewGradJSONFetcher(BaseFetcher):
             date_str = entry.get("date_posted") or entry.get("date_updated")
             if date_str:
                 try:
-                    posted_at = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
+                    posted_at = datetime.fromisoformat(date_str)
+                except (ValueError, TypeError):
                     pass
 
             uid = Job.generate_uid(self.source_group, raw_id=entry.get("id"))
@@ -3,12 +3,24 @@
 import hashlib
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
 
+# Markdown files downloaded concurrently
+MAX_WORKERS = 8
+
+# Table separator cell, e.g. the "---" or ":-:" in |---|:-:|
+_SEP_RE = re.compile(r"^[-:]+$")
+# [text](url) markdown links: text required when stripping, optional when extracting
+_MD_LINK_TEXT_RE = re.compile(r"\[([^\]]+)\]\([^)]+\)")
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+_TAG_RE = re.compile(r"<[^>]+>")
+_URL_RE = re.compile(r"https?://[^\s<>\"']+")
+
 
 class NewGradMarkdownFetcher(BaseFetcher):
     source_group = "newgrad"
@@ -21,23 +33,35 @@ class NewGradMarkdownFetcher(BaseFetcher):
         self._files = source_config.get("files", [])
 
     def fetch(self) -> list[Job]:
+        if not self._files:
+            return []
+
+        # Downloads are independent, so fetch them concurrently; parsing stays
+        # sequential and in file order
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(self._files))) as executor:
+            texts = list(executor.map(self._fetch_file, self._files))
+
         jobs = []
-        for filename in self._files:
-            url = (
-                f"https://raw.githubusercontent.com/{self._owner}/{self._repo}"
-                f"/{self._branch}/{filename}"
-            )
-            resp = resilient_get(url)
-            resp.raise_for_status()
-            jobs.extend(self._parse_markdown_table(resp.text, filename))
+        for filename, text in zip(self._files, texts):
+            jobs.extend(self._parse_markdown_table(text, filename))
         return jobs
 
+    def _fetch_file(self, filename: str) -> str:
+        url = (
+            f"https://raw.githubusercontent.com/{self._owner}/{self._repo}"
+            f"/{self._branch}/{filename}"
+        )
+        resp = resilient_get(url)
+        check_status(resp)
+        return resp.text
+
     def _parse_markdown_table(self, text: str, filename: str) -> list[Job]:
         """Parse markdown tables with | delimiters into Job objects."""
         jobs = []
         lines = text.strip().split("\n")
         header_indices = {}
         in_table = False
+        sep_match = _SEP_RE.match
 
         for line in lines:
             line = line.strip()
@@ -49,7 +73,7 @@ class NewGradMarkdownFetcher(BaseFetcher):
             cells = [c.strip() for c in line.split("|")[1:-1]]
 
             # Detect separator row (e.g., |---|---|---|)
-            if all(re.match(r"^[-:]+$", c) for c in cells if c):
+            if all(sep_match(c) for c in cells if c):
                 in_table = True
                 continue
 
@@ -104,21 +128,27 @@ class NewGradMarkdownFetcher(BaseFetcher):
         if index is None or index >= len(cells):
             return ""
         cell = cells[index]
+        # Most cells are plain text; only run a regex when its marker is present
         # Strip markdown links: [text](url) -> text
-        cell = re.sub(r"\[([^\]]+)\]\([^)]+\)", r"\1", cell)
+        if "[" in cell:
+            cell = _MD_LINK_TEXT_RE.sub(r"\1", cell)
         # Strip HTML tags
-        cell = re.sub(r"<[^>]+>", "", cell)
+        if "<" in cell:
+            cell = _TAG_RE.sub("", cell)
         return cell.strip()
 
     @staticmethod
     def _extract_url(cell: str) -> str:
         """Extract URL from a markdown cell."""
         # Try markdown link first: [text](url)
-        match = re.search(r"\[([^\]]*)\]\(([^)]+)\)", cell)
-        if match:
-            return match.group(2)
+        if "](" in cell:
+            match = _MD_LINK_RE.search(cell)
+            if match:
+                return match.group(2)
         # Try bare URL
-        match = re.search(r"https?://[^\s<>\"']+", cell)
+        if "http" not in cell:
+            return ""
+        match = _URL_RE.search(cell)
         if match:
             return match.group(0)
         return ""
@@ -15,7 +15,7 @@ import re
 from datetime import datetime
 from typing import Optional
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -123,7 +123,7 @@ class OracleFetcher(BaseFetcher):
             params=params,
             headers={"Accept": "application/json"},
         )
-        resp.raise_for_status()
+        check_status(resp)
         return resp.json()
 
     def _parse_job(self, req: dict) -> Optional[Job]:
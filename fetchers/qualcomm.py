@@ -3,7 +3,7 @@
 import logging
 import re
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -69,7 +69,7 @@ class QualcommFetcher(BaseFetcher):
                 params["location"] = self._location_filter
 
             resp = resilient_get(self._base_url, params=params)
-            resp.raise_for_status()
+            check_status(resp)
             data = resp.json()
 
             positions = data.get("positions", [])
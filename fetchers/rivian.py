@@ -29,7 +29,7 @@ import logging
 import re
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -94,7 +94,7 @@ class RivianFetcher(BaseFetcher):
                 params=params,
                 headers={"Accept": "application/json"},
             )
-            resp.raise_for_status()
+            check_status(resp)
             data = resp.json()
 
             job_list = data.get("jobs", [])
@@ -126,8 +126,8 @@ class RivianFetcher(BaseFetcher):
                 posted_date = job_data.get("posted_date")
                 if posted_date:
                     try:
-                        posted_at = datetime.fromisoformat(posted_date.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
+                        posted_at = datetime.fromisoformat(posted_date)
+                    except (ValueError, TypeError):
                         pass
 
                 # Extract categories/tags
@@ -39,7 +39,7 @@ from tenacity import (
     wait_exponential,
 )
 
-from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT, resilient_get
+from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -125,7 +125,7 @@ class ShopifyFetcher(BaseFetcher):
                     time.sleep(backoff)
                     continue
 
-                resp.raise_for_status()
+                check_status(resp)
                 resp_text = resp.text
                 break
 
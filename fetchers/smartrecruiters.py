@@ -3,7 +3,7 @@
 import logging
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,7 @@ class SmartRecruitersFetcher(BaseFetcher):
                 f"?offset={offset}&limit={limit}"
             )
             resp = resilient_get(url)
-            resp.raise_for_status()
+            check_status(resp)
             data = resp.json()
 
             for item in data.get("content", []):
@@ -57,8 +57,8 @@ class SmartRecruitersFetcher(BaseFetcher):
                 released_date = item.get("releasedDate")
                 if released_date:
                     try:
-                        posted_at = datetime.fromisoformat(released_date.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
+                        posted_at = datetime.fromisoformat(released_date)
+                    except (ValueError, TypeError):
                         pass
 
                 # Build snippet from employment type, function, and experience level
@@ -2,7 +2,7 @@
 
 import logging
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -18,7 +18,7 @@ class WorkableFetcher(BaseFetcher):
     def fetch(self) -> list[Job]:
         url = f"https://apply.workable.com/api/v1/widget/accounts/{self._subdomain}"
         resp = resilient_get(url)
-        resp.raise_for_status()
+        check_status(resp)
         data = resp.json()
 
         jobs = []
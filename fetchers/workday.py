@@ -4,7 +4,7 @@ import logging
 from datetime import datetime
 from urllib.parse import urlparse
 
-from fetchers.base import BaseFetcher, resilient_post
+from fetchers.base import BaseFetcher, resilient_post, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -49,7 +49,7 @@ class WorkdayFetcher(BaseFetcher):
                 json=payload,
                 headers={"Content-Type": "application/json"},
             )
-            resp.raise_for_status()
+            check_status(resp)
             data = resp.json()
 
             job_postings = data.get("jobPostings", [])
@@ -68,8 +68,8 @@ class WorkdayFetcher(BaseFetcher):
                 posted_on = item.get("postedOn")
                 if posted_on:
                     try:
-                        posted_at = datetime.fromisoformat(posted_on.replace("Z", "+00:00"))
-                    except (ValueError, AttributeError):
+                        posted_at = datetime.fromisoformat(posted_on)
+                    except (ValueError, TypeError):
                         pass
 
                 uid = Job.generate_uid(self.source_group, url=full_url)
@@ -5,7 +5,7 @@ import re
 
 import requests
 
-from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT
+from fetchers.base import BaseFetcher, USER_AGENT, DEFAULT_TIMEOUT, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -34,7 +34,7 @@ class YCFetcher(BaseFetcher):
         for page in range(self._max_pages):
             try:
                 resp = session.get(url, timeout=DEFAULT_TIMEOUT)
-                resp.raise_for_status()
+                check_status(resp)
             except Exception as e:
                 logger.warning("YC: failed to fetch page %d: %s", page + 1, e)
                 break
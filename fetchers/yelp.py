@@ -4,7 +4,7 @@ import logging
 import re
 from datetime import datetime
 
-from fetchers.base import BaseFetcher, resilient_get
+from fetchers.base import BaseFetcher, resilient_get, check_status
 from models import Job
 
 logger = logging.getLogger(__name__)
@@ -36,7 +36,7 @@ class YelpFetcher(BaseFetcher):
         """
         url = "https://yelp-community.career.page/api/jobs"
         resp = resilient_get(url)
-        resp.raise_for_status()
+        check_status(resp)
         data = resp.json()
 
         jobs = []
@@ -5,14 +5,13 @@ import os
 import signal
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from config import AppConfig, is_dry_run, load_config
-from discord_notifier import notify
+from discord_notifier import notify_batch
 from fetchers.amazon import AmazonFetcher
 from fetchers.apple import AppleFetcher
 from fetchers.ashby import AshbyFetcher
-from fetchers.base import BaseFetcher
+from fetchers.base import BaseFetcher, run_all_fetchers
 from fetchers.google import GoogleFetcher
 from fetchers.greenhouse import GreenhouseFetcher
 from fetchers.hnhiring import HNHiringFetcher
@@ -39,6 +38,7 @@ from fetchers.goldmansachs import GoldmanSachsFetcher
 from fetchers.jibe import JibeFetcher
 from fetchers.linkedin import LinkedInFetcher
 from filtering import filter_job
+from models import Job
 from state import StateStore
 
 logger = logging.getLogger(__name__)
@@ -131,39 +131,37 @@ def poll_once(
 
     # Fetch all sources in parallel
     logger.info(f"Fetching {len(fetchers_to_run)} sources in parallel...")
+    jobs = run_all_fetchers([fetcher for fetcher, _ in fetchers_to_run])
 
-    with ThreadPoolExecutor(max_workers=min(50, len(fetchers_to_run))) as executor:
-        # Submit all fetch tasks
-        future_to_fetcher = {
-            executor.submit(fetcher.safe_fetch): (fetcher, key)
-            for fetcher, key in fetchers_to_run
-        }
-
-        # Process results as they complete
-        for future in as_completed(future_to_fetcher):
-            fetcher, key = future_to_fetcher[future]
-            try:
-                jobs = future.result()
-
-                for job in jobs:
-                    if state.is_seen(job.uid):
-                        continue
-
-                    passed, matched_kw = filter_job(job, config)
-
-                    if not passed:
-                        # Filtered out — mark seen to avoid re-evaluation
-                        state.mark_seen(job.uid, job.source_group, job.url)
-                        continue
-
-                    success = notify(job, matched_kw, config)
-                    if success:
-                        state.mark_seen(job.uid, job.source_group, job.url)
-                        new_count += 1
-                    # If notify fails, don't mark seen — retry next cycle
-
-            except Exception as e:
-                logger.error(f"Error processing results from {key}: {e}")
+    # Collect new matches; notifications are sent in one batch below.
+    # Several fetchers can emit the same job, so key by uid to notify once.
+    new_jobs: dict[str, tuple[Job, list[str]]] = {}
+    for job in jobs:
+        try:
+            if job.uid in new_jobs or state.is_seen(job.uid):
+                continue
+
+            passed, matched_kw = filter_job(job, config)
+
+            if not passed:
+                # Filtered out — mark seen to avoid re-evaluation
+                state.mark_seen(job.uid, job.source_group, job.url)
+                continue
+
+            new_jobs[job.uid] = (job, matched_kw)
+        except Exception as e:
+            logger.error(f"Error processing job {job.uid}: {e}")
+
+    pending = list(new_jobs.values())
+    try:
+        results = notify_batch(pending, config)
+        for (job, _), success in zip(pending, results):
+            if success:
+                state.mark_seen(job.uid, job.source_group, job.url)
+                new_count += 1
+            # If notify fails, don't mark seen — retry next cycle
+    except Exception as e:
+        logger.error(f"Error sending notifications: {e}")
 
     return new_count
 
@@ -1,16 +1,21 @@
 """Job model and UID generation."""
 
+import functools
 import hashlib
 import re
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse
 
-from pydantic import BaseModel, field_validator
 
+@dataclass(slots=True, kw_only=True)
+class Job:
+    """Normalized job posting.
 
-class Job(BaseModel):
-    """Normalized job posting."""
+    A plain slotted dataclass: fetchers build thousands of these per cycle,
+    and field validation is not needed for data we construct ourselves.
+    """
 
     uid: str
     source_group: str
@@ -23,16 +28,18 @@ class Job(BaseModel):
     snippet: str = ""
     posted_at: Optional[datetime] = None
     raw_id: Optional[str] = None
-    tags: list[str] = []
+    tags: list[str] = field(default_factory=list)
 
-    @field_validator("snippet", mode="before")
-    @classmethod
-    def truncate_snippet(cls, v: str) -> str:
-        if v and len(v) > 2000:
-            return v[:1997] + "..."
-        return v or ""
+    def __post_init__(self) -> None:
+        # Truncate long snippets
+        snippet = self.snippet
+        if snippet and len(snippet) > 2000:
+            self.snippet = snippet[:1997] + "..."
+        elif not snippet:
+            self.snippet = ""
 
     @staticmethod
+    @functools.lru_cache(maxsize=50_000)
     def generate_uid(
         source_group: str,
         *,
@@ -48,6 +55,8 @@ class Job(BaseModel):
         1. "{source_group}:{raw_id}" if raw_id provided
         2. SHA-256 of "{source_group}:{canonical_url}" if url provided
         3. SHA-256 of "{source_group}:{title}:{company}:{location}:{posted_at}"
+
+        Memoized: fetchers regenerate the same UIDs every poll cycle.
         """
         if raw_id:
             return f"{source_group}:{raw_id}"
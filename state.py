@@ -5,7 +5,11 @@ from datetime import datetime, timezone
 
 
 class StateStore:
-    """Tracks seen job UIDs to prevent duplicate notifications."""
+    """Tracks seen job UIDs to prevent duplicate notifications.
+
+    All UIDs are mirrored in an in-memory set loaded at startup, so the
+    per-job is_seen() check never touches SQLite.
+    """
 
     def __init__(self, db_path: str = "seen_jobs.db"):
         self._conn = sqlite3.connect(db_path)
@@ -20,15 +24,18 @@ class StateStore:
             """
         )
         self._conn.commit()
+        self._seen: set[str] = {
+            row[0] for row in self._conn.execute("SELECT uid FROM seen_items")
+        }
 
     def is_seen(self, uid: str) -> bool:
-        cursor = self._conn.execute(
-            "SELECT 1 FROM seen_items WHERE uid = ?", (uid,)
-        )
-        return cursor.fetchone() is not None
+        return uid in self._seen
 
     def mark_seen(self, uid: str, source_group: str, url: str = "") -> None:
-        """Mark a UID as seen. Idempotent via INSERT OR IGNORE."""
+        """Mark a UID as seen. Idempotent."""
+        if uid in self._seen:
+            return
+        self._seen.add(uid)
         self._conn.execute(
             "INSERT OR IGNORE INTO seen_items (uid, first_seen_ts, source_group, url) VALUES (?, ?, ?, ?)",
             (uid, datetime.now(timezone.utc).isoformat(), source_group, url),
@@ -7,13 +7,21 @@ from pathlib import Path
 
 import pytest
 
-from config import AppConfig
+from config import AppConfig, is_dry_run
 from models import Job
 from state import StateStore
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _reset_dry_run_cache():
+    """is_dry_run() is cached per process; tests toggle DRY_RUN freely."""
+    is_dry_run.cache_clear()
+    yield
+    is_dry_run.cache_clear()
+
+
 @pytest.fixture
 def sample_job():
     return Job(
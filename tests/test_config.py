@@ -48,6 +48,20 @@ class TestLoadConfig:
 
         assert "DISCORD_WEBHOOK_NONEXISTENT" in caplog.text
 
+    def test_cached_until_file_changes(self, tmp_path):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps({"poll_interval_seconds": 300}))
+
+        first = load_config(str(config_file), env_path=None)
+        assert load_config(str(config_file), env_path=None) is first
+
+        config_file.write_text(json.dumps({"poll_interval_seconds": 120}))
+        os.utime(config_file, ns=(0, config_file.stat().st_mtime_ns + 1_000_000))
+
+        reloaded = load_config(str(config_file), env_path=None)
+        assert reloaded is not first
+        assert reloaded.poll_interval_seconds == 120
+
 
 class TestGetWebhookUrl:
     def test_returns_url(self, sample_config, monkeypatch):
@@ -1,12 +1,16 @@
 """Tests for discord_notifier.py."""
 
 import os
+import time
 from datetime import datetime, timezone
 
+import orjson
 import responses
 
+import discord_notifier
 from config import AppConfig
-from discord_notifier import build_embed, notify
+from discord_notifier import build_embed, notify, notify_batch
+from fetchers.base import TokenBucket
 from models import Job
 
 
@@ -87,3 +91,62 @@ class TestNotify:
         job = _make_job()
         result = notify(job, [], sample_config)
         assert result is False
+
+
+class TestNotifyBatch:
+    def test_dry_run(self, sample_config, monkeypatch):
+        monkeypatch.setenv("DRY_RUN", "true")
+        jobs = [(_make_job(uid=f"test:{i}"), []) for i in range(3)]
+        assert notify_batch(jobs, sample_config) == [True, True, True]
+
+    @responses.activate
+    def test_packs_ten_embeds_per_post(self, sample_config, monkeypatch):
+        monkeypatch.setenv("DRY_RUN", "false")
+        monkeypatch.setenv("DISCORD_WEBHOOK_TEST", "https://discord.com/api/webhooks/test/token")
+        responses.add(
+            responses.POST,
+            "https://discord.com/api/webhooks/test/token",
+            status=204,
+        )
+        jobs = [(_make_job(uid=f"test:{i}"), ["python"]) for i in range(23)]
+        results = notify_batch(jobs, sample_config)
+        assert results == [True] * 23
+        assert len(responses.calls) == 3
+
+    def test_missing_webhook(self, sample_config, monkeypatch):
+        monkeypatch.setenv("DRY_RUN", "false")
+        monkeypatch.delenv("DISCORD_WEBHOOK_TEST", raising=False)
+        assert notify_batch([(_make_job(), [])], sample_config) == [False]
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate_per_sec=0.5, capacity=2)
+        assert bucket.acquire() == 0
+        assert bucket.acquire() == 0
+        # Third request must wait ~one refill interval (2s at 0.5/s)
+        assert 1.9 < bucket.acquire() <= 2.0
+
+
+class TestCooldownPersistence:
+    @responses.activate
+    def test_429_cooldown_written_hashed(self, sample_config, monkeypatch, tmp_path):
+        url = "https://discord.com/api/webhooks/test/secret-token"
+        path = tmp_path / "state" / "cooldowns.json"
+        monkeypatch.setenv("DRY_RUN", "false")
+        monkeypatch.setenv("DISCORD_WEBHOOK_TEST", url)
+        monkeypatch.setattr(discord_notifier, "COOLDOWNS_PATH", str(path))
+        monkeypatch.setattr(discord_notifier, "_rate_limit_cooldowns", {})
+        responses.add(responses.POST, url, status=429, headers={"Retry-After": "60"})
+
+        assert notify(_make_job(), [], sample_config) is False
+
+        assert "secret-token" not in path.read_text()
+        loaded = discord_notifier._load_cooldowns(str(path))
+        assert list(loaded) == [discord_notifier._cooldown_key(url)]
+        assert loaded[discord_notifier._cooldown_key(url)] > time.time() + 50
+
+    def test_expired_entries_dropped_on_load(self, tmp_path):
+        path = tmp_path / "cooldowns.json"
+        path.write_bytes(orjson.dumps({"old": time.time() - 1, "new": time.time() + 60}))
+        assert list(discord_notifier._load_cooldowns(str(path))) == ["new"]
@@ -1,6 +1,7 @@
 """Tests for Apple fetcher."""
 
 import responses
+from responses import matchers
 
 from fetchers.apple import AppleFetcher
 
@@ -45,7 +46,7 @@ class TestAppleFetcher:
         assert jobs[0].company == "Apple"
         assert "Software and Services" in jobs[0].tags
 
-        assert jobs[1].title == "Ml Engineer Siri"
+        assert jobs[1].title == "ML Engineer Siri"
         assert "Machine Learning and AI" in jobs[1].tags
 
     @responses.activate
@@ -81,7 +82,9 @@ class TestAppleFetcher:
         assert jobs == []
 
     @responses.activate
-    def test_pagination(self):
+    def test_pagination(self, mocker):
+        # Pages past 2 in the fetch window aren't registered; skip their retry backoff
+        mocker.patch("fetchers.base.time.sleep")
         # Page 1 with next page link
         page1_html = """
         <html>
@@ -100,18 +103,15 @@ class TestAppleFetcher:
         </html>
         """
 
-        responses.add(
-            responses.GET,
-            SEARCH_URL,
-            body=page1_html,
-            status=200,
-        )
-        responses.add(
-            responses.GET,
-            SEARCH_URL,
-            body=page2_html,
-            status=200,
-        )
+        # Pages are fetched concurrently, so match each response on its page number
+        for page, body in ((1, page1_html), (2, page2_html)):
+            responses.add(
+                responses.GET,
+                SEARCH_URL,
+                body=body,
+                status=200,
+                match=[matchers.query_param_matcher({"location": "united-states-USA", "page": str(page)})],
+            )
 
         fetcher = AppleFetcher({"name": "Apple", "company": "Apple", "max_pages": 5})
         jobs = fetcher.fetch()
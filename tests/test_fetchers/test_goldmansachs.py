@@ -0,0 +1,163 @@
+"""Tests for Goldman Sachs fetcher."""
+
+import json
+
+import pytest
+import responses
+
+from fetchers import goldmansachs
+from fetchers.goldmansachs import CAREERS_URL, GRAPHQL_ENDPOINT, GoldmanSachsFetcher
+
+
+@pytest.fixture(autouse=True)
+def _fresh_caches(monkeypatch):
+    monkeypatch.setattr(goldmansachs, "_careers_html_cache", goldmansachs._TTLCache(300))
+    monkeypatch.setattr(goldmansachs, "_graphql_cache", goldmansachs._TTLCache(60))
+
+
+def _fetcher(**overrides) -> GoldmanSachsFetcher:
+    config = {"name": "Goldman Sachs", "request_delay": 0, "divisions": []}
+    config.update(overrides)
+    return GoldmanSachsFetcher(config)
+
+
+class TestGoldmanSachsFetcher:
+    @responses.activate
+    def test_graphql_jobs(self):
+        responses.add(
+            responses.POST,
+            GRAPHQL_ENDPOINT,
+            json={
+                "data": {
+                    "roleSearch": {
+                        "totalCount": 1,
+                        "items": [
+                            {
+                                "roleId": 123,
+                                "jobTitle": "Software Engineer",
+                                "corporateTitle": "Analyst",
+                                "division": "Engineering",
+                                "locations": [{"city": "New York", "state": "New York", "country": "United States"}],
+                            }
+                        ],
+                    }
+                }
+            },
+        )
+
+        jobs = _fetcher().fetch()
+
+        assert len(jobs) == 1
+        assert jobs[0].title == "Software Engineer"
+        assert jobs[0].location == "New York, United States"
+        assert jobs[0].url == "https://higher.gs.com/roles/123"
+
+    @responses.activate
+    def test_graphql_fetches_remaining_pages(self):
+        def respond(request):
+            page = json.loads(request.body)["variables"]["searchQueryInput"]["page"]["pageNumber"]
+            items = [{"roleId": page * 10 + i, "jobTitle": f"Engineer {page}-{i}"} for i in range(2)]
+            return 200, {}, json.dumps({"data": {"roleSearch": {"totalCount": 5, "items": items}}})
+
+        responses.add_callback(responses.POST, GRAPHQL_ENDPOINT, callback=respond)
+
+        jobs = _fetcher(page_size=2).fetch()
+
+        assert len(responses.calls) == 3
+        assert [j.title for j in jobs] == [f"Engineer {p}-{i}" for p in range(3) for i in range(2)]
+
+    @responses.activate
+    def test_fallbacks_share_one_careers_page_request(self):
+        responses.add(responses.GET, CAREERS_URL, body="<html>no roles here</html>")
+
+        jobs = _fetcher(use_graphql=False).fetch()
+
+        assert jobs == []
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_url_scraping(self):
+        responses.add(
+            responses.GET,
+            CAREERS_URL,
+            body='<a href="/roles/42/software-engineer-nyc">x</a><a href="/roles/42">dup</a>',
+        )
+
+        jobs = _fetcher(use_graphql=False).fetch()
+
+        assert [j.title for j in jobs] == ["Software Engineer NYC"]
+        assert jobs[0].url == "https://higher.gs.com/roles/42/software-engineer-nyc"
+
+    def test_find_jobs_in_nested_apollo_state(self):
+        state = {
+            "ROOT_QUERY": {"meta": {"count": 1}},
+            "Search:1": {"results": {"roles": [{"jobTitle": "Engineer", "roleId": "1"}]}},
+        }
+        assert _fetcher()._find_jobs_in_data(state) == [{"jobTitle": "Engineer", "roleId": "1"}]
+        assert _fetcher()._find_jobs_in_data(state, max_depth=2) == []
+
+    @responses.activate
+    def test_keywords_filter_case_insensitively(self):
+        responses.add(
+            responses.GET,
+            CAREERS_URL,
+            body='<a href="/roles/1/software-engineer">a</a><a href="/roles/2/sales-associate">b</a>',
+        )
+
+        jobs = _fetcher(use_graphql=False, keywords=["Software"]).fetch()
+
+        assert [j.title for j in jobs] == ["Software Engineer"]
+
+    def test_is_remote(self):
+        fetcher = _fetcher()
+        assert fetcher._is_remote({"jobType": {"description": "Virtual"}}) is True
+        assert fetcher._is_remote({"locations": {"city": "Remote - US"}}) is True
+        assert fetcher._is_remote({"jobTitle": "Engineer (Remote)"}) is True
+        assert fetcher._is_remote({"jobTitle": "Engineer", "jobType": {"description": None}}) is False
+
+    def test_token_bucket_spaces_requests(self, mocker):
+        sleep = mocker.patch("fetchers.goldmansachs.time.sleep")
+        fetcher = _fetcher(request_delay=1.0)
+        fetcher._throttle()
+        sleep.assert_not_called()
+        fetcher._throttle()
+        assert 0.9 < sleep.call_args.args[0] <= 1.0
+
+    def test_embedded_apollo_state(self):
+        next_data = '{"props": {"pageProps": {"initialApolloState": {"Q": {"roles": [{"jobTitle": "SWE"}]}}}}}'
+        html = f'<script id="__NEXT_DATA__" type="application/json">{next_data}</script>'
+        assert _fetcher()._extract_embedded_jobs(html) == [{"jobTitle": "SWE"}]
+
+        empty = '<script id="__NEXT_DATA__">{"props": {"pageProps": {"initialApolloState": {}}}}</script>'
+        assert _fetcher()._extract_embedded_jobs(empty) == []
+
+    def test_format_location(self):
+        fetcher = _fetcher()
+        london = {"city": "London", "country": "United Kingdom"}
+        nyc = {"city": "New York", "state": "New York", "country": "United States", "primary": True}
+        assert fetcher._format_location([nyc]) == "New York, United States"
+        assert fetcher._format_location(["Remote", london, nyc]) == "New York, United States +2 more"
+        assert fetcher._format_location([london, {"city": "Dallas", "state": "Texas"}]) == (
+            "London, United Kingdom | Dallas, Texas"
+        )
+        assert fetcher._format_location({}) == ""
+
+    def test_role_links_single_regex_pass(self, monkeypatch):
+        scanned = []
+
+        class RecordingPattern:
+            def finditer(self, text):
+                scanned.append(text)
+                return _ROLE_URL_RE.finditer(text)
+
+        _ROLE_URL_RE = goldmansachs._ROLE_URL_RE
+        monkeypatch.setattr(goldmansachs, "_ROLE_URL_RE", RecordingPattern())
+        padding = "<div>filler</div>" * 50_000
+        html = (
+            f'<html><body>{padding}<a href="/roles/7/data-engineer">x</a>'
+            '<script>{"url": "/roles/8"}</script></body></html>'
+        )
+
+        assert list(goldmansachs._iter_role_links(html)) == [("7", "data-engineer"), ("8", "")]
+        # One scan of the page, no DOM parse or per-node rescans on large pages
+        assert scanned == [html]
@@ -1,7 +1,11 @@
 """Tests for iCIMS fetcher."""
 
+from datetime import datetime
+
+import pytest
 import responses
 
+from fetchers import icims
 from fetchers.icims import ICIMSFetcher
 
 
@@ -59,3 +63,83 @@ class TestICIMSFetcher:
         )
         jobs = fetcher.safe_fetch()
         assert jobs == []
+
+
+LISTINGS_HTML = """
+<div class="container-fluid iCIMS_JobsTable">
+  <div class="row">
+    <div class="col-xs-6 header left">
+      <span class="sr-only field-label">Job Locations</span>
+      <span>US-TX-Austin</span>
+    </div>
+    <div class="col-xs-6 header right">
+      <span class="sr-only field-label">Posted Date</span>
+      <span title="1/15/2026 10:30 AM">2 weeks ago</span>
+    </div>
+    <div class="col-xs-12 title">
+      <a href="https://careers.acme.com/jobs/12345/software-engineer-i/job?in_iframe=1" class="iCIMS_Anchor">
+        <h3><span class="sr-only field-label">Job Title</span> Software Engineer I</h3>
+      </a>
+    </div>
+    <div class="col-xs-12 description">Work on <b>cutting-edge</b> R&amp;D systems.</div>
+    <div class="col-xs-12 additionalFields">
+      <dl><div><dt>Category</dt><dd><span>Engineering</span></dd></div></dl>
+    </div>
+  </div>
+  <div class="row">
+    <div class="col-xs-6 header left">
+      <span class="sr-only field-label">Job Locations</span>
+      <span>US-NY-New York</span>
+    </div>
+    <div class="col-xs-12 title">
+      <a href="https://careers.acme.com/jobs/67890/data-analyst/job?in_iframe=1" title="67890 - Data Analyst">x</a>
+    </div>
+  </div>
+</div>
+"""
+
+
+class TestICIMSListingParser:
+    @pytest.mark.parametrize("use_selectolax", [True, False])
+    def test_parse_listings(self, monkeypatch, use_selectolax):
+        if not use_selectolax:
+            monkeypatch.setattr(icims, "LexborHTMLParser", None)
+        fetcher = ICIMSFetcher({"name": "Acme", "portal_url": "https://careers.acme.com", "company": "Acme"})
+
+        jobs = fetcher._parse_listings(LISTINGS_HTML)
+
+        assert [j.raw_id for j in jobs] == ["12345", "67890"]
+        first, second = jobs
+        assert first.title == "Software Engineer I"
+        assert first.url == "https://careers.acme.com/jobs/12345/software-engineer-i/job"
+        assert first.location == "US-TX-Austin"
+        assert first.posted_at == datetime(2026, 1, 15, 10, 30)
+        assert first.snippet == "Work on cutting-edge R&D systems."
+        assert first.tags == ["Engineering"]
+        assert second.title == "Data Analyst"
+        assert second.location == "US-NY-New York"
+        assert second.posted_at is None
+
+    @responses.activate
+    def test_fetches_remaining_pages(self):
+        url = "https://careers.acme.com/jobs/search"
+        for page in range(3):
+            paging = '<div class="iCIMS_PagingBatch">Page 1 of 3</div>' if page == 0 else ""
+            responses.add(
+                responses.GET,
+                url,
+                body=LISTINGS_HTML.replace("12345", f"1{page}").replace("67890", f"2{page}") + paging,
+                match=[responses.matchers.query_param_matcher({"ss": "1", "in_iframe": "1", "pr": str(page)})],
+            )
+
+        fetcher = ICIMSFetcher({"name": "Acme", "portal_url": "https://careers.acme.com"})
+        jobs = fetcher.fetch()
+
+        assert [j.raw_id for j in jobs] == ["10", "20", "11", "21", "12", "22"]
+
+    def test_clean_job_url(self):
+        assert icims._clean_job_url("https://a.com/jobs/1/x/job?in_iframe=1") == "https://a.com/jobs/1/x/job"
+        assert icims._clean_job_url("https://a.com/jobs/1/x/job?in_iframe=1&mode=job") == (
+            "https://a.com/jobs/1/x/job?mode=job"
+        )
+        assert icims._clean_job_url("https://a.com/jobs/1/x/job") == "https://a.com/jobs/1/x/job"
@@ -0,0 +1,40 @@
+"""Tests for Intuit fetcher."""
+
+import responses
+
+from fetchers.intuit import RESULTS_URL, IntuitFetcher
+
+RESULTS_HTML = """
+<section id="search-results-list"><ul>
+  <li><a href="/job/mountain-view/software-engineer-1/27595/111" data-job-id="111">
+    <h2>Software Engineer 1</h2>
+    <span class="job-location">Mountain View, California</span>
+  </a></li>
+  <li><a href="/job/new-york/data-scientist/27595/222" data-job-id="222">
+    <h2>Data Scientist</h2>
+    <span class="job-location">New York, New York</span>
+  </a></li>
+</ul></section>
+"""
+
+
+class TestIntuitFetcher:
+    @responses.activate
+    def test_results_endpoint(self):
+        responses.add(responses.GET, RESULTS_URL, json={"results": RESULTS_HTML, "hasJobs": True})
+
+        fetcher = IntuitFetcher({"name": "Intuit", "results_per_page": 15})
+        jobs = fetcher.fetch()
+
+        assert len(responses.calls) == 1
+        assert [j.raw_id for j in jobs] == ["111", "222"]
+        assert jobs[0].title == "Software Engineer 1"
+        assert jobs[0].location == "Mountain View, California"
+        assert jobs[0].url == "https://jobs.intuit.com/job/mountain-view/software-engineer-1/27595/111"
+
+    @responses.activate
+    def test_no_selenium_fallback_when_disabled(self):
+        responses.add(responses.GET, RESULTS_URL, json={"results": "", "hasJobs": False})
+
+        fetcher = IntuitFetcher({"name": "Intuit", "selenium_fallback": False})
+        assert fetcher.fetch() == []
@@ -0,0 +1,83 @@
+"""Tests for Jibe fetcher."""
+
+import json
+import re
+
+import responses
+
+from fetchers.jibe import JibeFetcher
+
+API_URL = "https://careers.example.com/api/jobs"
+
+
+def _page(start: int, count: int) -> dict:
+    return {
+        "jobs": [
+            {
+                "data": {
+                    "req_id": str(n),
+                    "title": f"Software Engineer {n}",
+                    "city": "Austin",
+                    "state": "Texas",
+                    "country": "United States",
+                    "description": "<p>Build <b>things</b></p>",
+                    "posted_date": "2026-01-15T00:00:00Z",
+                }
+            }
+            for n in range(start, start + count)
+        ]
+    }
+
+
+def _register_pages(pages: dict[int, dict]):
+    def callback(request):
+        page = int(re.search(r"page=(\d+)", request.url).group(1))
+        return 200, {}, json.dumps(pages.get(page, {"jobs": []}))
+
+    responses.add_callback(responses.GET, re.compile(re.escape(API_URL)), callback=callback)
+
+
+class TestJibeFetcher:
+    @responses.activate
+    def test_paginates_until_short_page(self):
+        _register_pages({1: _page(0, 10), 2: _page(10, 10), 3: _page(20, 3)})
+
+        fetcher = JibeFetcher({"name": "Example", "base_url": "https://careers.example.com/", "company": "Example"})
+        jobs = fetcher.fetch()
+
+        assert [j.raw_id for j in jobs] == [str(n) for n in range(23)]
+        assert jobs[0].location == "Austin, Texas, United States"
+        assert jobs[0].snippet == "Build things"
+        assert jobs[0].posted_at is not None
+
+    @responses.activate
+    def test_short_first_page_is_single_request(self):
+        _register_pages({1: _page(0, 4)})
+
+        fetcher = JibeFetcher({"name": "Example", "base_url": "https://careers.example.com"})
+        jobs = fetcher.fetch()
+
+        assert len(jobs) == 4
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_respects_max_pages(self):
+        _register_pages({p: _page(p * 10, 10) for p in range(1, 30)})
+
+        fetcher = JibeFetcher({"name": "Example", "base_url": "https://careers.example.com", "max_pages": 3})
+        jobs = fetcher.fetch()
+
+        assert len(jobs) == 30
+        assert len(responses.calls) == 3
+
+    @responses.activate
+    def test_total_count_limits_requests(self):
+        pages = {p: _page(p * 10, 10) for p in range(1, 30)}
+        pages[1]["totalCount"] = 25
+        _register_pages(pages)
+
+        fetcher = JibeFetcher({"name": "Example", "base_url": "https://careers.example.com"})
+        jobs = fetcher.fetch()
+
+        assert len(jobs) == 30
+        assert len(responses.calls) == 3
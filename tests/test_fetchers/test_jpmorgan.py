@@ -0,0 +1,64 @@
+"""Tests for JPMorgan fetcher."""
+
+import json
+import re
+
+import responses
+
+from fetchers.jpmorgan import ORACLE_API_BASE, JPMorganFetcher
+
+
+def _page(start: int, count: int, total: int) -> dict:
+    return {
+        "items": [
+            {
+                "TotalJobsCount": total,
+                "requisitionList": [
+                    {
+                        "Id": str(n),
+                        "Title": f"Software Engineer {n}",
+                        "PrimaryLocation": "New York, NY",
+                        "PrimaryLocationCountry": "US",
+                        "PostedDate": "2026-01-15",
+                        "JobFamily": "Technology",
+                        "ShortDescriptionStr": "<p>Build <b>systems</b></p>",
+                    }
+                    for n in range(start, start + count)
+                ],
+            }
+        ]
+    }
+
+
+def _register(total: int, limit: int):
+    def callback(request):
+        offset = int(re.search(r"offset=(\d+)", request.url).group(1))
+        count = max(0, min(limit, total - offset))
+        return 200, {}, json.dumps(_page(offset, count, total))
+
+    responses.add_callback(responses.GET, re.compile(re.escape(ORACLE_API_BASE)), callback=callback)
+
+
+class TestJPMorganFetcher:
+    @responses.activate
+    def test_fetches_all_offsets(self):
+        _register(total=25, limit=10)
+
+        fetcher = JPMorganFetcher({"name": "JPMorgan", "limit": 10})
+        jobs = fetcher.fetch()
+
+        assert [j.raw_id for j in jobs] == [str(n) for n in range(25)]
+        assert len(responses.calls) == 3
+        assert jobs[0].snippet == "Family: Technology | Build systems"
+        assert jobs[0].tags == ["Technology", "US"]
+        assert jobs[0].posted_at is not None
+
+    @responses.activate
+    def test_single_page(self):
+        _register(total=4, limit=10)
+
+        fetcher = JPMorganFetcher({"name": "JPMorgan", "limit": 10})
+        jobs = fetcher.fetch()
+
+        assert len(jobs) == 4
+        assert len(responses.calls) == 1
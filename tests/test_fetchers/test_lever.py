@@ -1,7 +1,10 @@
 """Tests for Lever fetcher."""
 
+from collections import OrderedDict
+
 import responses
 
+from fetchers import base
 from fetchers.lever import LeverFetcher
 
 
@@ -36,3 +39,44 @@ class TestLeverFetcher:
         fetcher = LeverFetcher({"name": "Empty", "slug": "empty"})
         jobs = fetcher.fetch()
         assert jobs == []
+
+    @responses.activate
+    def test_not_modified_replays_cached_body(self, load_fixture, monkeypatch):
+        monkeypatch.setattr(base, "_validator_cache", OrderedDict())
+        url = "https://api.lever.co/v0/postings/acme?mode=json"
+        responses.add(responses.GET, url, json=load_fixture("lever_response.json"), headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304)
+
+        fetcher = LeverFetcher({"name": "Acme-Lever", "slug": "acme", "company": "Acme"})
+        first = fetcher.fetch()
+        second = fetcher.fetch()
+
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert [j.uid for j in second] == [j.uid for j in first]
+
+    @responses.activate
+    def test_not_modified_restores_content_type(self, monkeypatch):
+        monkeypatch.setattr(base, "_validator_cache", OrderedDict())
+        url = "https://api.lever.co/v0/postings/acme?mode=json"
+        responses.add(responses.GET, url, json=[], headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, status=304, content_type=None)
+
+        base.conditional_get(url)
+        resp = base.conditional_get(url)
+
+        assert resp.status_code == 200
+        assert resp.content == b"[]"
+        assert resp.headers["Content-Type"] == "application/json"
+
+    @responses.activate
+    def test_validator_cache_evicts_least_recently_used(self, monkeypatch):
+        monkeypatch.setattr(base, "_validator_cache", OrderedDict())
+        monkeypatch.setattr(base, "VALIDATOR_CACHE_SIZE", 2)
+        urls = [f"https://api.lever.co/v0/postings/co{n}?mode=json" for n in range(3)]
+        for url in urls:
+            responses.add(responses.GET, url, json=[], headers={"ETag": '"v1"'})
+
+        for url in urls:
+            base.conditional_get(url)
+
+        assert list(base._validator_cache) == urls[1:]
@@ -0,0 +1,121 @@
+"""Tests for LinkedIn fetcher."""
+
+import re
+import threading
+import time
+
+import responses
+
+from fetchers.linkedin import LinkedInFetcher
+
+CARDS_HTML = """
+<li>
+  <div class="base-card job-search-card">
+    <a class="base-card__full-link absolute" href="https://www.linkedin.com/jobs/view/software-engineer-at-acme-4012345678?refId=abc&amp;trk=guest">
+      <span class="sr-only">Software Engineer</span>
+    </a>
+    <div class="base-search-card__info">
+      <h3 class="base-search-card__title">
+        Software Engineer
+      </h3>
+      <h4 class="base-search-card__subtitle">
+        <a href="https://www.linkedin.com/company/acme">Acme  Corp</a>
+      </h4>
+      <div class="base-search-card__metadata">
+        <span class="job-search-card__location">
+          Austin, TX
+        </span>
+        <time class="job-search-card__listdate" datetime="2026-01-15">1 day ago</time>
+      </div>
+    </div>
+  </div>
+</li>
+<li>
+  <div class="base-card">
+    <a class="base-card__full-link" href="https://www.linkedin.com/jobs/view/data-engineer-4087654321">
+    </a>
+    <h3 class="base-search-card__title">Data Engineer</h3>
+  </div>
+</li>
+<li><div class="no-link">Promoted</div></li>
+"""
+
+
+def _fetcher(**overrides) -> LinkedInFetcher:
+    config = {
+        "name": "LinkedIn",
+        "companies": [{"name": "Acme", "linkedin_id": "1234"}],
+        "request_delay": [0, 0],
+    }
+    config.update(overrides)
+    return LinkedInFetcher(config)
+
+
+class TestLinkedInFetcher:
+    def test_parse_cards(self):
+        jobs = _fetcher()._parse_jobs(CARDS_HTML, "Acme")
+
+        assert [j.raw_id for j in jobs] == ["4012345678", "4087654321"]
+        first = jobs[0]
+        assert first.url == "https://www.linkedin.com/jobs/view/software-engineer-at-acme-4012345678"
+        assert first.title == "Software Engineer"
+        assert first.company == "Acme Corp"
+        assert first.location == "Austin, TX"
+        assert first.posted_at is not None
+        # Missing subtitle falls back to the configured company name
+        assert jobs[1].company == "Acme"
+
+    def test_parse_empty(self):
+        assert _fetcher()._parse_jobs("", "Acme") == []
+
+    @responses.activate
+    def test_fetch_companies(self):
+        responses.add(responses.GET, re.compile(r"https://www\.linkedin\.com/jobs-guest/.*f_C=1234"), body=CARDS_HTML)
+        responses.add(responses.GET, re.compile(r"https://www\.linkedin\.com/jobs-guest/.*f_C=5678"), status=500)
+
+        fetcher = _fetcher(
+            companies=[
+                {"name": "Acme", "linkedin_id": "1234"},
+                {"name": "Globex", "linkedin_id": "5678"},
+            ]
+        )
+        jobs = fetcher.fetch()
+
+        assert [j.raw_id for j in jobs] == ["4012345678", "4087654321"]
+
+    @responses.activate
+    def test_rate_limit_sets_backoff(self):
+        responses.add(responses.GET, re.compile(r"https://www\.linkedin\.com/jobs-guest/"), status=429)
+
+        fetcher = _fetcher()
+        assert fetcher.fetch() == []
+        assert fetcher._backoff == 60
+
+    @responses.activate
+    def test_concurrent_429_burst_escalates_once(self):
+        # Hold every request until all four are in flight, so they all
+        # come back 429 together
+        barrier = threading.Barrier(4, timeout=5)
+
+        def callback(request):
+            barrier.wait()
+            return 429, {}, ""
+
+        responses.add_callback(responses.GET, re.compile(r"https://www\.linkedin\.com/jobs-guest/"), callback=callback)
+
+        fetcher = _fetcher(companies=[{"name": f"Co{n}", "linkedin_id": str(n)} for n in range(4)])
+        assert fetcher.fetch() == []
+        assert fetcher._backoff == 60
+
+    def test_stale_success_keeps_backoff(self, monkeypatch):
+        fetcher = _fetcher()
+        fetcher._backoff = 60
+        fetcher._paused_until = time.monotonic() + 60
+
+        # Response to a request sent before the pause started
+        monkeypatch.setattr(fetcher, "_fetch_company", lambda *args: [])
+        monkeypatch.setattr(time, "monotonic", lambda: fetcher._paused_until - 120)
+        monkeypatch.setattr(time, "sleep", lambda seconds: None)
+        fetcher._fetch_company_throttled(None, {"name": "Acme", "linkedin_id": "1234"})
+
+        assert fetcher._backoff == 60
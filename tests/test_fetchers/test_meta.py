@@ -2,7 +2,7 @@
 
 import responses
 
-from fetchers.meta import MetaFetcher
+from fetchers.meta import MetaFetcher, _iter_embedded_json
 
 CAREERS_URL = "https://www.metacareers.com/jobs"
 GRAPHQL_URL = "https://www.metacareers.com/api/graphql/"
@@ -68,3 +68,35 @@ class TestMetaFetcher:
         )
         jobs = fetcher.safe_fetch()
         assert jobs == []
+
+    @responses.activate
+    def test_embedded_relay_data(self):
+        page = (
+            '<script>__RELAY_DATA__ = {"job_search": {"results": ['
+            '{"id": "META9", "title": "Production Engineer", '
+            '"locations": ["Seattle, WA"], "description": "<p>Keep things up};</p>"}'
+            "]}};</script>"
+        )
+        responses.add(responses.GET, CAREERS_URL, body=page, status=200)
+
+        fetcher = MetaFetcher({"name": "Meta", "company": "Meta"})
+        jobs = fetcher.fetch()
+
+        assert [j.uid for j in jobs] == ["maang:meta:META9"]
+        assert jobs[0].location == "Seattle, WA"
+        assert jobs[0].snippet == "Keep things up};"
+
+
+class TestEmbeddedJson:
+    def test_anchors_in_order(self):
+        text = (
+            '<div data-content="{&quot;results&quot;: [{&quot;id&quot;: 3}]}"></div>'
+            '"job_search": {"results": [{"id": 2}]}, "other": 1'
+        )
+        assert list(_iter_embedded_json(text)) == [
+            {"results": [{"id": 2}]},
+            {"results": [{"id": 3}]},
+        ]
+
+    def test_invalid_json_yields_none(self):
+        assert list(_iter_embedded_json("__RELAY_DATA__ = {broken")) == [None]
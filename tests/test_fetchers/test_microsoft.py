@@ -1,10 +1,17 @@
 """Tests for Microsoft fetcher."""
 
+import json
+import re
+
 import responses
 
-from fetchers.microsoft import MicrosoftFetcher
+from fetchers.microsoft import API_URL, MicrosoftFetcher
+
 
-BASE_URL = "https://gcsservices.careers.microsoft.com/search/api/v1/search"
+def _fetcher(**overrides) -> MicrosoftFetcher:
+    config = {"name": "Microsoft", "company": "Microsoft", "selenium_fallback": False}
+    config.update(overrides)
+    return MicrosoftFetcher(config)
 
 
 class TestMicrosoftFetcher:
@@ -13,44 +20,56 @@ class TestMicrosoftFetcher:
         fixture = load_fixture("microsoft_response.json")
         responses.add(
             responses.GET,
-            BASE_URL,
+            API_URL,
             json=fixture,
             status=200,
         )
 
-        fetcher = MicrosoftFetcher({"name": "Microsoft", "company": "Microsoft"})
-        jobs = fetcher.fetch()
+        jobs = _fetcher().fetch()
 
         assert len(jobs) == 2
         assert jobs[0].title == "Software Engineer"
-        assert jobs[0].uid == "maang:microsoft:MS-100001"
+        assert jobs[0].uid == "maang:microsoft:1970393556621001"
         assert jobs[0].company == "Microsoft"
         assert jobs[0].location == "Redmond, WA"
-        assert "jobs.careers.microsoft.com" in jobs[0].url
+        assert "apply.careers.microsoft.com" in jobs[0].url
         assert "azure" in jobs[0].snippet.lower()
+        assert jobs[1].location == "Bellevue, WA | Redmond, WA"
+
+    @responses.activate
+    def test_paginates_up_to_max_pages(self):
+        def callback(request):
+            start = int(re.search(r"start=(\d+)", request.url).group(1))
+            positions = [{"id": n, "name": f"Engineer {n}"} for n in range(start, start + 10)]
+            return 200, {}, json.dumps({"count": 1000, "positions": positions})
+
+        responses.add_callback(responses.GET, re.compile(re.escape(API_URL)), callback=callback)
+
+        jobs = _fetcher(results_per_page=10, max_pages=3).fetch()
+
+        assert len(responses.calls) == 3
+        assert [j.raw_id for j in jobs] == [f"microsoft:{n}" for n in range(30)]
 
     @responses.activate
     def test_empty_response(self):
         responses.add(
             responses.GET,
-            BASE_URL,
-            json={"operationResult": {"result": {"totalJobs": 0, "jobs": []}}},
+            API_URL,
+            json={"count": 0, "positions": []},
             status=200,
         )
 
-        fetcher = MicrosoftFetcher({"name": "Microsoft", "company": "Microsoft"})
-        jobs = fetcher.fetch()
+        jobs = _fetcher().fetch()
         assert jobs == []
 
     @responses.activate
     def test_safe_fetch_on_error(self):
         responses.add(
             responses.GET,
-            BASE_URL,
+            API_URL,
             body="Service Unavailable",
             status=403,
         )
 
-        fetcher = MicrosoftFetcher({"name": "Microsoft", "company": "Microsoft"})
-        jobs = fetcher.safe_fetch()
+        jobs = _fetcher().safe_fetch()
         assert jobs == []
@@ -1,5 +1,8 @@
 """Tests for Netflix fetcher."""
 
+import json
+import re
+
 import responses
 
 from fetchers.netflix import NetflixFetcher
@@ -53,3 +56,19 @@ class TestNetflixFetcher:
         fetcher = NetflixFetcher({"name": "Netflix", "company": "Netflix"})
         jobs = fetcher.safe_fetch()
         assert jobs == []
+
+    @responses.activate
+    def test_paginates_concurrently(self):
+        def callback(request):
+            start = int(re.search(r"start=(\d+)", request.url).group(1))
+            count = max(0, min(100, 250 - start))
+            positions = [{"id": n, "name": f"Engineer {n}"} for n in range(start, start + count)]
+            return 200, {}, json.dumps({"count": 250, "positions": positions})
+
+        responses.add_callback(responses.GET, re.compile(re.escape(BASE_URL)), callback=callback)
+
+        fetcher = NetflixFetcher({"name": "Netflix", "company": "Netflix"})
+        jobs = fetcher.fetch()
+
+        assert len(responses.calls) == 3
+        assert [j.raw_id for j in jobs] == [f"netflix:{n}" for n in range(250)]
@@ -53,3 +53,24 @@ class TestNewGradMarkdownFetcher:
         })
         jobs = fetcher.fetch()
         assert jobs == []
+
+    @responses.activate
+    def test_multiple_files_keep_order(self):
+        base = "https://raw.githubusercontent.com/test/repo/main"
+        responses.add(responses.GET, f"{base}/A.md", body=SAMPLE_MD, status=200)
+        responses.add(
+            responses.GET,
+            f"{base}/B.md",
+            body=SAMPLE_MD.replace("TechCo", "OtherCo").replace("techco", "otherco"),
+            status=200,
+        )
+
+        fetcher = NewGradMarkdownFetcher({
+            "name": "test",
+            "owner": "test",
+            "repo": "repo",
+            "files": ["A.md", "B.md"],
+        })
+        jobs = fetcher.fetch()
+
+        assert [j.company for j in jobs] == ["TechCo", "DataCorp", "OtherCo", "DataCorp"]
@@ -1,5 +1,6 @@
 """Tests for models.py."""
 
+from dataclasses import asdict
 from datetime import datetime, timezone
 
 from models import Job
@@ -50,7 +51,7 @@ class TestJobModel:
         assert job.snippet == ""
 
     def test_serialization(self, sample_job):
-        data = sample_job.model_dump()
+        data = asdict(sample_job)
         assert data["uid"] == "test:123"
         assert data["tags"] == ["python", "react"]
         assert isinstance(data["posted_at"], datetime)
@@ -1,5 +1,7 @@
 """Tests for state.py."""
 
+from state import StateStore
+
 
 class TestStateStore:
     def test_is_seen_false_initially(self, in_memory_state):
@@ -24,3 +26,14 @@ class TestStateStore:
         in_memory_state.mark_seen("a:1", "a", "")
         assert in_memory_state.is_seen("a:1") is True
         assert in_memory_state.is_seen("a:2") is False
+
+    def test_seen_uids_survive_reopen(self, tmp_path):
+        db_path = str(tmp_path / "seen.db")
+        store = StateStore(db_path)
+        store.mark_seen("a:1", "a", "")
+        store.close()
+
+        reopened = StateStore(db_path)
+        assert reopened.is_seen("a:1") is True
+        assert reopened.count() == 1
+        reopened.close()